@@ -1,11 +1,107 @@
+import codecs
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta
 import pytz
 from config import Config
+from rate_limiter import (
+    RateLimiter, RateLimitExceeded,
+    PRIORITY_INTERACTIVE, PRIORITY_DEFAULT, PRIORITY_BACKGROUND,
+)
+from response_cache import ResponseCache, inflate_text
+from single_flight import SingleFlight
+from json_stream import iter_json_array
 import streamlit as st
 
 DEFAULT_TIMEZONE = Config.DEFAULT_TIMEZONE
 
+# ----- Shared HTTP transport -----
+# One keep-alive connection pool per process. urllib3's pool manager is
+# thread-safe; requests.Session is not guaranteed to be, so every thread gets
+# its own lightweight Session mounted on the same adapter.
+_adapter = None
+_adapter_lock = threading.Lock()
+_thread_local = threading.local()
+
+# Process-wide quota pacing shared by every client instance and thread.
+_rate_limiter = RateLimiter(
+    per_minute=Config.RATE_LIMIT_PER_MINUTE,
+    per_day=Config.RATE_LIMIT_PER_DAY,
+    reserve=Config.RATE_LIMIT_RESERVE,
+)
+
+# Endpoints whose payload for a finished season never changes.
+_SEASON_ENDPOINTS = ("games", "standings", "teams", "players")
+
+
+def _open_response_cache():
+    if not Config.RESPONSE_CACHE_ENABLED:
+        return None
+    try:
+        return ResponseCache(
+            Config.RESPONSE_CACHE_PATH,
+            max_bytes=Config.RESPONSE_CACHE_MAX_BYTES,
+            ttls=Config.RESPONSE_CACHE_TTLS,
+            default_ttl=Config.CACHE_DURATION,
+        )
+    except (OSError, sqlite3.Error) as e:
+        st.warning(f"Persistent response cache disabled: {e}")
+        return None
+
+
+_response_cache = _open_response_cache()
+
+# Identical concurrent requests (same endpoint + params) share one upstream call.
+_single_flight = SingleFlight()
+
+# Stale cache hits are served immediately and refreshed here in the background.
+_revalidate_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _get_adapter():
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                pool_block=Config.HTTP_POOL_BLOCK,
+                max_retries=Config.HTTP_MAX_RETRIES,
+            )
+        return _adapter
+
+
+def get_http_session():
+    """Return this thread's Session, backed by the process-wide connection pool."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        adapter = _get_adapter()
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+
+def _odds_game_id(entry):
+    """Game id of an /odds entry (raw['game']['id'], raw['fixture']['id'] or raw['id'])."""
+    for section in ("game", "fixture"):
+        if isinstance(entry.get(section), dict) and entry[section].get("id") is not None:
+            return entry[section]["id"]
+    return entry.get("id")
+
+
+def _is_live_window(endpoint, params):
+    """A /games request for a date window: the in-progress poll of LiveScoreEngine."""
+    return endpoint == "games" and bool(params) and ("from" in params or "to" in params)
+
+
 class APISportsClient:
     def __init__(self):
         self.base_url = Config.get_base_url()
@@ -14,47 +110,233 @@ class APISportsClient:
             st.error("API client not initialized: missing headers.")
             raise ValueError("API key missing")
 
+    def _get(self, endpoint, params=None, timeout=Config.HTTP_TIMEOUT, priority=PRIORITY_DEFAULT, stream=False):
+        """
+        GET an endpoint (e.g. "games", "odds/bets") through the shared pool,
+        paced by the quota scheduler. Raises RateLimitExceeded if no token
+        frees up within RATE_LIMIT_MAX_WAIT.
+        """
+        if not _rate_limiter.acquire(priority, timeout=Config.RATE_LIMIT_MAX_WAIT):
+            raise RateLimitExceeded(f"API quota exhausted, skipped /{endpoint.lstrip('/')}")
+        url = self.base_url + endpoint.lstrip("/")
+        response = get_http_session().get(url, headers=self.headers, params=params, timeout=timeout, stream=stream)
+        _rate_limiter.update_from_headers(response.headers, response.status_code)
+        return response
+
+    def _get_json(self, endpoint, params=None, timeout=Config.HTTP_TIMEOUT, priority=PRIORITY_DEFAULT):
+        """
+        JSON envelope for an endpoint, served from the persistent cache when
+        possible. A recently expired entry is returned immediately while a
+        background refresh replaces it (stale-while-revalidate). Concurrent
+        misses for the same endpoint + params are coalesced into one upstream
+        request whose parsed envelope is shared by every waiter (treat it as
+        read-only). Raises requests.RequestException on transport/HTTP errors.
+        """
+        def fetch():
+            data = self._cached(endpoint, params, timeout)
+            if data is not None:
+                return data
+            return self._fetch_and_store(endpoint, params, timeout, priority)
+
+        return _single_flight.do(ResponseCache.make_key(endpoint, params), fetch)
+
+    def _cached(self, endpoint, params, timeout, raw=False):
+        """
+        Cached entry (fresh, or recently expired and now revalidating) or
+        None: the envelope or, with `raw`, its compressed JSON body. Live-window
+        polls are never served stale: the previous poll's scores would defeat
+        the poll.
+        """
+        if _response_cache is None:
+            return None
+        max_stale = 0 if _is_live_window(endpoint, params) else Config.RESPONSE_CACHE_MAX_STALE
+        read = _response_cache.get_blob if raw else _response_cache.get
+        hit = read(endpoint, params, max_stale=max_stale)
+        if hit is None:
+            return None
+        data, is_fresh = hit
+        if not is_fresh:
+            self._revalidate(endpoint, params, timeout)
+        return data
+
+    def _iter_json(self, endpoint, params=None, timeout=Config.HTTP_TIMEOUT, priority=PRIORITY_DEFAULT):
+        """
+        Streaming mode: yield the items of the envelope's "response" array
+        one at a time while the body downloads, so only one decoded item is
+        held at once. The body itself is kept only zlib-compressed: it is
+        deflated as it streams, cached once complete, and cache hits are
+        inflated and parsed the same incremental way. Coalescing works as in
+        _get_json: concurrent misses wait for the one streaming request and
+        then parse its compressed body. Raises requests.RequestException on
+        transport/HTTP errors, including a connection dropped mid-stream, and
+        Exception on API "errors".
+        """
+        blob = self._cached(endpoint, params, timeout, raw=True)
+        if blob is None:
+            key = ResponseCache.make_key(endpoint, params)
+            call, leader = _single_flight.join(key)
+            if leader:
+                yield from self._stream_and_store(key, call, endpoint, params, timeout, priority)
+                return
+            blob = _single_flight.wait(call)
+        envelope = {}
+        yield from iter_json_array(inflate_text(blob, Config.STREAM_CHUNK_SIZE), "response", envelope)
+        if envelope.get("errors"):
+            raise Exception(f"API Error: {envelope['errors']}")
+
+    def _stream_and_store(self, key, call, endpoint, params, timeout, priority):
+        """_iter_json's upstream path; hands the compressed body to the coalesced waiters."""
+        envelope, deflater, parts = {}, zlib.compressobj(6), []
+
+        def text_chunks(response):
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+            for chunk in response.iter_content(Config.STREAM_CHUNK_SIZE):
+                text = decoder.decode(chunk)
+                parts.append(deflater.compress(text.encode("utf-8")))
+                yield text
+
+        try:
+            with self._get(endpoint, params, timeout=timeout, priority=priority, stream=True) as response:
+                response.raise_for_status()
+                yield from iter_json_array(text_chunks(response), "response", envelope)
+        except BaseException as e:
+            # A reader that stops early must not leave the waiters without an outcome.
+            error = e if isinstance(e, Exception) else requests.RequestException("stream abandoned")
+            _single_flight.finish(key, call, error=error)
+            raise
+        parts.append(deflater.flush())
+        blob = b"".join(parts)
+        if _response_cache is not None and not envelope.get("errors"):
+            _response_cache.set_blob(endpoint, params, blob, ttl=self._cache_ttl(endpoint, params))
+        _single_flight.finish(key, call, result=blob)
+        if envelope.get("errors"):
+            raise Exception(f"API Error: {envelope['errors']}")
+
+    def _fetch_and_store(self, endpoint, params, timeout, priority):
+        response = self._get(endpoint, params, timeout=timeout, priority=priority)
+        response.raise_for_status()
+        data = response.json()
+        if _response_cache is not None and not data.get("errors"):
+            _response_cache.set(endpoint, params, data, ttl=self._cache_ttl(endpoint, params))
+        return data
+
+    def _revalidate(self, endpoint, params, timeout):
+        key = ResponseCache.make_key(endpoint, params)
+        with _revalidating_lock:
+            if key in _revalidating:
+                return
+            _revalidating.add(key)
+
+        def run():
+            try:
+                self.refresh(endpoint, params, timeout=timeout)
+            except requests.RequestException:
+                pass
+            finally:
+                with _revalidating_lock:
+                    _revalidating.discard(key)
+
+        _revalidate_pool.submit(run)
+
+    def refresh(self, endpoint, params=None, timeout=Config.HTTP_TIMEOUT, priority=PRIORITY_BACKGROUND):
+        """
+        Re-fetch an endpoint upstream, bypassing the cache, and store the
+        result. Used by the background refresher to keep the working set warm.
+        """
+        # Separate key: a refresh must not coalesce with a read that is about to return stale data.
+        key = "refresh:" + ResponseCache.make_key(endpoint, params)
+        return _single_flight.do(key, lambda: self._fetch_and_store(endpoint, params, timeout, priority))
+
+    def warm(self, endpoint, params=None, priority=PRIORITY_BACKGROUND):
+        """Ensure a fresh copy is cached, going upstream only on a miss or expiry."""
+        if _response_cache is not None:
+            hit = _response_cache.get(endpoint, params)
+            if hit is not None:
+                return hit[0]
+        return self.refresh(endpoint, params, priority=priority)
+
+    def _cache_ttl(self, endpoint, params):
+        if _is_live_window(endpoint, params):
+            return Config.LIVE_POLL_INTERVAL
+        params = params or {}
+        season = params.get("season")
+        if endpoint in _SEASON_ENDPOINTS and season and self.is_season_finished(season):
+            return Config.RESPONSE_CACHE_PAST_SEASON_TTL
+        return None
+
+    def rate_budget(self):
+        """Remaining per-minute and per-day quota as last reported by the API."""
+        return _rate_limiter.budget()
+
+    def has_response_cache(self):
+        """False when the persistent cache is disabled or could not be opened."""
+        return _response_cache is not None
+
+    def request_stats(self):
+        """Executed vs. coalesced (shared in-flight) request counts since process start."""
+        return _single_flight.stats()
+
+    def quota_low(self, threshold=Config.QUOTA_LOW_THRESHOLD):
+        """True when optional fetches should be skipped to protect the quota."""
+        budget = _rate_limiter.budget()
+        day_remaining = budget["day_remaining"]
+        return budget["minute_remaining"] < threshold or (day_remaining is not None and day_remaining < threshold)
+
     def get_current_season(self):
         return datetime.now().year
+
+    def is_season_finished(self, season) -> bool:
+        """
+        A season is named for the year it starts, but its playoffs run into
+        the next one: it only counts as finished SEASON_END_GRACE_DAYS after
+        that year ends.
+        """
+        season_end = datetime(int(season) + 1, 1, 1) + timedelta(days=Config.SEASON_END_GRACE_DAYS)
+        return datetime.now() >= season_end
         
     def get_seasons(self):
         """
         Fetch all available seasons from the API.
         """
-        url = f"{self.base_url}/seasons"
-        response = requests.get(url, headers=self.headers)
-        data = response.json()
+        data = self._get_json("seasons")
         if data.get("errors"):
             raise Exception(f"API Error: {data['errors']}")
         return data.get("response", [])
 
 
-    def get_standings(self, league_id, season):
-        url = f"{self.base_url}standings"
+    def get_standings(self, league_id, season, priority=PRIORITY_DEFAULT):
         params = {"league": league_id, "season": season}
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json("standings", params, priority=priority)
             resp = data.get("response", [])
             return [d for d in resp if isinstance(d, dict)]
         except requests.RequestException as e:
             st.error(f"Error fetching standings: {e}")
             return []
 
-    def get_games(self, league: int, season: int, date_from: str = None, date_to: str = None):
-        url = f"{self.base_url}games"
+    def get_games(self, league: int, season: int, date_from: str = None, date_to: str = None,
+                  priority=PRIORITY_DEFAULT):
         params = {"league": league, "season": season}
         if date_from: params["from"] = date_from
         if date_to: params["to"] = date_to
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-            response.raise_for_status()
-            return response.json().get("response", [])
+            return self._get_json("games", params, priority=priority).get("response", [])
         except requests.RequestException as e:
             st.error(f"Error fetching games: {e}")
             return []
 
+    def iter_games(self, league: int, season: int, date_from: str = None, date_to: str = None,
+                   priority=PRIORITY_DEFAULT):
+        """
+        Streaming variant of get_games: yields raw game dicts as they are
+        parsed. Unlike get_games it raises on failure (also mid-stream), so a
+        caller can tell a partial season from a complete one.
+        """
+        params = {"league": league, "season": season}
+        if date_from: params["from"] = date_from
+        if date_to: params["to"] = date_to
+        yield from self._iter_json("games", params, priority=priority)
+
     def format_datetime(self, dt_str, tz=DEFAULT_TIMEZONE):
         try:
             dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
@@ -64,46 +346,63 @@ class APISportsClient:
         except Exception:
             return dt_str
 
-    def get_teams(self, league: int, season: int):
-        url = f"{self.base_url}/teams"
+    def get_teams(self, league: int, season: int, priority=PRIORITY_DEFAULT):
         params = {"league": league, "season": season}
-        response = requests.get(url, headers=self.headers, params=params)
-        data = response.json()
+        data = self._get_json("teams", params, priority=priority)
         if data.get("errors"):
             raise Exception(f"API Error: {data['errors']}")
         return data.get("response", [])
 
-    def get_players(self, team: int, season: int):
-        url = f"{self.base_url}/players"
+    def get_players(self, team: int, season: int, priority=PRIORITY_DEFAULT):
         params = {"team": team, "season": season}
-        response = requests.get(url, headers=self.headers, params=params)
-        data = response.json()
+        data = self._get_json("players", params, priority=priority)
         if data.get("errors"):
             raise Exception(f"API Error: {data['errors']}")
         return data.get("response", [])
 
-    def get_player_statistics(self, player_id: int, season: int):
-        url = f"{self.base_url}/players/statistics"
+    def iter_team_rosters(self, team_ids, season: int,
+                          max_workers: int = Config.ROSTER_FANOUT_WORKERS,
+                          deadline: float = Config.ROSTER_FANOUT_DEADLINE):
+        """
+        Fetch several teams' rosters concurrently and yield (team_id, players)
+        in completion order. A failed team yields (team_id, None). Once
+        `deadline` seconds have passed, teams still in flight are abandoned
+        and the generator simply stops, so callers keep the partial results.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roster")
+        futures = {
+            executor.submit(self.get_players, team=t, season=season, priority=PRIORITY_BACKGROUND): t
+            for t in team_ids
+        }
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                team_id = futures[future]
+                try:
+                    yield team_id, future.result()
+                except Exception:
+                    yield team_id, None
+        except FuturesTimeout:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_player_statistics(self, player_id: int, season: int, priority=PRIORITY_INTERACTIVE):
         params = {"id": player_id, "season": season}
-        response = requests.get(url, headers=self.headers, params=params)
-        data = response.json()
+        data = self._get_json("players/statistics", params, priority=priority)
         if data.get("errors"):
             raise Exception(f"API Error: {data['errors']}")
         return data.get("response", [])
 
     # ----- New method for Odds -----
-    def get_odds(self, league_id: int, season: int, date: str = None):
+    def get_odds(self, league_id: int, season: int, date: str = None, priority=PRIORITY_DEFAULT):
         """
         Fetch pre-match odds for games. Optional date filter.
         """
-        url = f"{self.base_url}/odds"
         params = {"league": league_id, "season": season}
         if date:
             params["date"] = date
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json("odds", params, priority=priority)
             if data.get("errors"):
                 st.warning(f"Odds API returned errors: {data['errors']}")
                 return []
@@ -112,15 +411,25 @@ class APISportsClient:
             st.error(f"Error fetching odds: {e}")
             return []
 
+    def get_odds_by_game(self, league_id: int, season: int, dates, priority=PRIORITY_DEFAULT):
+        """
+        Batched odds: one /odds request per date, indexed by game id.
+        Returns {game_id: odds entry (with "bookmakers")}.
+        """
+        index = {}
+        for date in dates:
+            for entry in self.get_odds(league_id, season, date=date, priority=priority):
+                game_id = _odds_game_id(entry)
+                if game_id is not None:
+                    index[game_id] = entry
+        return index
+
     def get_bets(self):
         """
         Return the list of available bets (market types).
         """
-        url = f"{self.base_url}/odds/bets"
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json("odds/bets")
             if data.get("errors"):
                 st.warning(f"Bets API returned errors: {data['errors']}")
                 return []
@@ -128,3 +437,9 @@ class APISportsClient:
         except requests.RequestException as e:
             st.error(f"Error fetching bets: {e}")
             return []
+
+
+@st.cache_resource
+def get_api_client():
+    """Process-wide client shared by every page and session."""
+    return APISportsClient()
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import requests
+import streamlit as st
+
+from api_client import get_api_client
+from config import Config
+
+# API-Sports american-football in-progress status codes (plus the generic "LIVE").
+LIVE_STATUSES = {"LIVE", "Q1", "Q2", "Q3", "Q4", "OT", "HT"}
+
+
+def _games_have_live(envelope) -> bool:
+    for raw in (envelope or {}).get("response", []) or []:
+        status = (raw.get("game") or {}).get("status") or raw.get("status") or {}
+        if isinstance(status, dict):
+            status = status.get("short")
+        if str(status or "").upper() in LIVE_STATUSES:
+            return True
+    return False
+
+
+class BackgroundRefresher:
+    """
+    Keeps games, standings and teams warm in the response cache for every
+    configured league and season, so page reruns hit the cache instead of
+    paying upstream latency after a TTL expires.
+
+    Finished seasons are refreshed rarely (their cache TTL is long). A season
+    still running (including last season's playoffs in January-March) has
+    its games refreshed every REFRESH_LIVE_INTERVAL seconds while any of
+    them is live and every REFRESH_IDLE_INTERVAL otherwise.
+    """
+
+    def __init__(self, client, leagues, seasons):
+        self.client = client
+        self.leagues = list(leagues)
+        self.seasons = list(seasons)
+        self.current_season = max(self.seasons)
+        self.live = {}   # (league, season) -> any game live at the last refresh
+        self.last_error = None
+        self._due = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="background-refresher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _interval(self, endpoint, league, season):
+        if self.client.is_season_finished(season):
+            return Config.RESPONSE_CACHE_PAST_SEASON_TTL
+        if endpoint == "games":
+            return Config.REFRESH_LIVE_INTERVAL if self.live.get((league, season)) else Config.REFRESH_IDLE_INTERVAL
+        if endpoint == "standings":
+            return Config.REFRESH_STANDINGS_INTERVAL
+        return Config.REFRESH_TEAMS_INTERVAL
+
+    def _refresh(self, endpoint, league, season, first_pass=False):
+        params = {"league": league, "season": season}
+        # After a restart the persistent cache is usually still warm; only go upstream if it is not.
+        if first_pass:
+            envelope = self.client.warm(endpoint, params)
+        else:
+            envelope = self.client.refresh(endpoint, params)
+        if endpoint == "games" and not self.client.is_season_finished(season):
+            self.live[(league, season)] = _games_have_live(envelope)
+
+    def _run(self):
+        tasks = [(e, l, s) for s in self.seasons for l in self.leagues for e in ("games", "standings", "teams")]
+        # Current season first: that is what most users open.
+        tasks.sort(key=lambda t: t[2] != self.current_season)
+        while not self._stop.is_set():
+            now = time.monotonic()
+            for task in tasks:
+                if self._stop.is_set():
+                    return
+                if self._due.get(task, 0) > now:
+                    continue
+                if self.client.quota_low():
+                    break
+                # Reschedule from the refresh result (live state may have changed).
+                try:
+                    self._refresh(*task, first_pass=task not in self._due)
+                    self.last_error = None
+                    self._due[task] = time.monotonic() + self._interval(*task)
+                except requests.RequestException as e:
+                    self.last_error = str(e)
+                    self._due[task] = time.monotonic() + min(self._interval(*task), 60)
+            next_due = min(self._due.values(), default=now + 5)
+            self._stop.wait(min(max(next_due - time.monotonic(), 1), 5))
+
+
+@st.cache_resource
+def start_background_refresher():
+    """
+    Start the process-wide refresher once; returns None when disabled or when
+    there is no response cache to keep warm (refreshing would only spend quota).
+    """
+    if not Config.REFRESHER_ENABLED:
+        return None
+    client = get_api_client()
+    if not client.has_response_cache():
+        return None
+    current_season = client.get_current_season()
+    return BackgroundRefresher(
+        client,
+        leagues=(Config.NFL_LEAGUE_ID, Config.NCAA_LEAGUE_ID),
+        seasons=range(current_season - 2, current_season + 1),
+    ).start()
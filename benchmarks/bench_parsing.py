@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the parsing and model hot paths.
+
+Covers game_parser.parse_games (the Games page parser),
+date_normalizer.normalize_dates (every date shape it accepts),
+Standing.from_api_data and the DataProcessor DataFrame builders (including
+the one-pass standings_frame), over dummy_data payloads reshaped to the
+API-Sports american-football format and scaled up by replication, or
+(--synthetic) over one seeded synthetic_data season of the same size.
+
+Each benchmark records throughput (items/s, best of --repeat) and
+allocations (tracemalloc peak KiB and net live blocks). Results can be
+saved as a JSON baseline and later runs compared against it; a slowdown or
+memory growth beyond --tolerance exits non-zero, so it can gate a deploy.
+
+Usage:
+    python benchmarks/bench_parsing.py --save benchmarks/baseline.json
+    python benchmarks/bench_parsing.py --compare benchmarks/baseline.json --tolerance 0.2
+    python benchmarks/bench_parsing.py --synthetic --scales 1,250,1000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Keep imports side-effect free: no cache file, no background threads.
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
+os.environ.setdefault("REFRESHER_ENABLED", "false")
+
+import dummy_data  # noqa: E402
+from date_normalizer import normalize_dates  # noqa: E402
+from game_parser import parse_games  # noqa: E402
+from models import DataProcessor, Standing  # noqa: E402
+from synthetic_data import SyntheticDataset, SyntheticScale  # noqa: E402
+from streamlit import config as st_config  # noqa: E402
+from streamlit.logger import set_log_level  # noqa: E402
+
+# st calls outside `streamlit run` (parse_games' caption) log a missing-ScriptRunContext warning each.
+st_config.get_config_options()
+set_log_level("error")
+
+
+# ----- Payloads -----
+def api_sports_game(raw, game_id):
+    """Reshape a dummy_data game into the API-Sports american-football layout."""
+    fixture = raw["fixture"]
+    kickoff = datetime.fromisoformat(fixture["date"].replace("Z", "+00:00")).replace(tzinfo=timezone.utc)
+    home_total = raw["goals"]["home"]
+    away_total = raw["goals"]["away"]
+
+    def side(total):
+        quarters = {f"quarter_{i}": (total // 4 if total is not None else None) for i in range(1, 5)}
+        return {**quarters, "overtime": None, "total": total}
+
+    return {
+        "game": {
+            "id": game_id,
+            "stage": "Regular Season",
+            "week": raw["league"]["round"],
+            "date": {
+                "timezone": "UTC",
+                "date": kickoff.strftime("%Y-%m-%d"),
+                "time": kickoff.strftime("%H:%M"),
+                "timestamp": int(kickoff.timestamp()),
+            },
+            "venue": {"name": fixture["venue"]["name"], "city": fixture["venue"]["city"]},
+            "status": {"short": fixture["status"]["short"], "long": fixture["status"]["short"], "timer": None},
+        },
+        "league": raw["league"],
+        "teams": {
+            "home": {k: raw["teams"]["home"][k] for k in ("id", "name", "logo")},
+            "away": {k: raw["teams"]["away"][k] for k in ("id", "name", "logo")},
+        },
+        "scores": {"home": side(home_total), "away": side(away_total)},
+    }
+
+
+def api_sports_standing(raw):
+    """Reshape a dummy_data standing into the API-Sports american-football layout."""
+    totals = raw["all"]
+    return {
+        "league": {"id": 1, "season": 2024},
+        "conference": raw["group"]["name"],
+        "division": raw["team"].get("division"),
+        "position": raw["rank"],
+        "team": {k: raw["team"][k] for k in ("id", "name", "logo")},
+        "won": totals["win"],
+        "lost": totals["lose"],
+        "ties": totals["draw"],
+        "points": {
+            "for": totals["goals"]["for"],
+            "against": totals["goals"]["against"],
+            "difference": raw["goalsDiff"],
+        },
+        "records": {"home": "4-1", "road": "3-2", "conference": "5-2", "division": "2-1"},
+        "streak": raw["form"],
+    }
+
+
+def synthetic_dataset(scale, seed):
+    """One synthetic season sized to `scale` (16 games / 32 teams per unit)."""
+    size = SyntheticScale(teams=32 * scale, seasons=1, weeks=18, games_per_week=-(-16 * scale // 18))
+    return SyntheticDataset(seed=seed, league=1, first_season=2024, scale=size,
+                            now=datetime(2024, 11, 1, tzinfo=timezone.utc))
+
+
+def scaled_games(scale):
+    games = []
+    while len(games) < 16 * scale:
+        for raw in dummy_data.generate_dummy_games(1 + len(games) % 2, 2024):
+            games.append(api_sports_game(raw, len(games) + 1))
+    return games[:16 * scale]
+
+
+def scaled_standings(scale):
+    standings = []
+    while len(standings) < 32 * scale:
+        for raw in dummy_data.generate_dummy_standings(1 + len(standings) % 2, 2024):
+            standings.append(api_sports_standing(raw))
+    return standings[:32 * scale]
+
+
+DATE_SHAPES = {
+    "dict_timestamp": {"timezone": "UTC", "date": "2024-09-08", "time": "17:00", "timestamp": 1725814800},
+    "dict_date_time_hhmm": {"date": "2024-09-08", "time": "17:00"},
+    "dict_date_time_hhmmss": {"date": "2024-09-08", "time": "17:00:00"},
+    "dict_date_only": {"date": "2024-09-08"},
+    "dict_iso_value": {"start": "2024-09-08T17:00:00+00:00"},
+    "epoch_int": 1725814800,
+    "epoch_float": 1725814800.0,
+    "iso_zulu": "2024-09-08T17:00:00Z",
+    "iso_offset": "2024-09-08T13:00:00-04:00",
+    "space_separated": "2024-09-08 17:00",
+    "unparseable": "TBD",
+    "empty": None,
+}
+
+
+# ----- Measurement -----
+def measure(fn, items, repeat):
+    fn()  # warm-up
+    start = time.perf_counter()
+    fn()
+    single = max(time.perf_counter() - start, 1e-9)
+    number = max(1, int(0.05 / single))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    net_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "items": items,
+        "seconds": best,
+        "items_per_sec": round(items / best, 1),
+        "peak_kib": round(peak / 1024, 1),
+        "net_blocks": net_blocks,
+    }
+
+
+def run(scales, repeat, seed, synthetic=False):
+    random.seed(seed)
+    results = {}
+
+    for name, section in DATE_SHAPES.items():
+        batch = [section] * 1000
+        results[f"normalize_dates[{name}]"] = measure(
+            lambda b=batch: normalize_dates(b), len(batch), repeat)
+
+    for scale in scales:
+        if synthetic:
+            dataset = synthetic_dataset(scale, seed)
+            games_raw = dataset.games(2024)[:16 * scale]
+            standings_raw = dataset.standings(2024)
+        else:
+            games_raw = scaled_games(scale)
+            standings_raw = scaled_standings(scale)
+        games = parse_games(games_raw)
+        standings = [Standing.from_api_data(s) for s in standings_raw]
+
+        results[f"parse_games[x{scale}]"] = measure(
+            lambda: parse_games(games_raw), len(games_raw), repeat)
+        results[f"Standing.from_api_data[x{scale}]"] = measure(
+            lambda: [Standing.from_api_data(s) for s in standings_raw], len(standings_raw), repeat)
+        results[f"games_to_dataframe[x{scale}]"] = measure(
+            lambda: DataProcessor.games_to_dataframe(games), len(games), repeat)
+        results[f"standings_to_dataframe[x{scale}]"] = measure(
+            lambda: DataProcessor.standings_to_dataframe(standings), len(standings), repeat)
+        results[f"standings_frame[x{scale}]"] = measure(
+            lambda: DataProcessor.standings_frame(standings_raw), len(standings_raw), repeat)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return the list of regressions beyond `tolerance` (fractional)."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if current["items_per_sec"] < base["items_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['items_per_sec']:.0f} items/s vs baseline {base['items_per_sec']:.0f}")
+        if current["peak_kib"] > base["peak_kib"] * (1 + tolerance) + 16:
+            regressions.append(f"{name}: peak {current['peak_kib']} KiB vs baseline {base['peak_kib']} KiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parsing / model micro-benchmarks")
+    parser.add_argument("--scales", default="1,50,250", help="payload multipliers (16 games / 32 standings each)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--synthetic", action="store_true",
+                        help="use synthetic_data payloads (full seasons, realistic statuses) instead of dummy_data")
+    parser.add_argument("--save", help="write results to this JSON baseline")
+    parser.add_argument("--compare", help="compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run([int(s) for s in args.scales.split(",")], args.repeat, args.seed, args.synthetic)
+
+    print(f"{'benchmark':<44} {'items':>7} {'items/s':>12} {'peak KiB':>10} {'blocks':>8}")
+    for name, r in results.items():
+        print(f"{name:<44} {r['items']:>7} {r['items_per_sec']:>12.0f} {r['peak_kib']:>10} {r['net_blocks']:>8}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print("\n✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,67 @@ class Config:
     DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "US/Eastern")
     CACHE_DURATION = int(os.getenv("CACHE_DURATION", 300))
 
+    # HTTP transport (one keep-alive pool shared by the whole process)
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 4))   # distinct hosts kept pooled
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 32))          # connections per host
+    HTTP_POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true"
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 2))             # connection-level retries only
+    HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", 15))
+    STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 64 * 1024))   # bytes per read in streaming mode
+
+    # API quota pacing (re-synced from the API's rate-limit headers)
+    RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", 30))
+    RATE_LIMIT_PER_DAY = int(os.getenv("RATE_LIMIT_PER_DAY")) if os.getenv("RATE_LIMIT_PER_DAY") else None
+    RATE_LIMIT_RESERVE = int(os.getenv("RATE_LIMIT_RESERVE", 2))          # tokens kept for interactive requests
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", 30))     # seconds a request may queue
+    QUOTA_LOW_THRESHOLD = int(os.getenv("QUOTA_LOW_THRESHOLD", 5))
+
+    # Persistent response cache (SQLite, shared by all worker processes)
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", ".cache/api_responses.sqlite3")
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+    RESPONSE_CACHE_PAST_SEASON_TTL = int(os.getenv("RESPONSE_CACHE_PAST_SEASON_TTL", 30 * 86400))
+    SEASON_END_GRACE_DAYS = int(os.getenv("SEASON_END_GRACE_DAYS", 90))  # playoffs run into the next year
+    RESPONSE_CACHE_MAX_STALE = int(os.getenv("RESPONSE_CACHE_MAX_STALE", 6 * 3600))  # serve-stale window
+    RESPONSE_CACHE_TTLS = {   # seconds, per endpoint
+        "games": 300,
+        "standings": 1800,
+        "teams": 86400,
+        "players": 86400,
+        "players/statistics": 3600,
+        "odds": 600,
+        "odds/bets": 86400,
+        "seasons": 86400,
+    }
+
+    # Odds line-movement history (SQLite; a tick is stored only when a price changes)
+    ODDS_HISTORY_ENABLED = os.getenv("ODDS_HISTORY_ENABLED", "true").lower() == "true"
+    ODDS_HISTORY_PATH = os.getenv("ODDS_HISTORY_PATH", ".cache/odds_history.sqlite3")
+    ODDS_HISTORY_RETENTION_DAYS = float(os.getenv("ODDS_HISTORY_RETENTION_DAYS", 14))   # after a game's last change
+    ODDS_HISTORY_MAX_POINTS = int(os.getenv("ODDS_HISTORY_MAX_POINTS", 500))             # ticks kept per price series
+
+    # Finished-season snapshots (Arrow IPC files written by season_snapshots.py)
+    SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", ".cache/snapshots")
+    SNAPSHOT_MAX_OPEN = int(os.getenv("SNAPSHOT_MAX_OPEN", 16))    # league/seasons kept mapped at once
+
+    # Background refresher keeping games/standings/teams warm
+    REFRESHER_ENABLED = os.getenv("REFRESHER_ENABLED", "true").lower() == "true"
+    REFRESH_LIVE_INTERVAL = int(os.getenv("REFRESH_LIVE_INTERVAL", 30))        # games, while any game is live
+    REFRESH_IDLE_INTERVAL = int(os.getenv("REFRESH_IDLE_INTERVAL", 240))       # games, otherwise
+    REFRESH_STANDINGS_INTERVAL = int(os.getenv("REFRESH_STANDINGS_INTERVAL", 1500))
+    REFRESH_TEAMS_INTERVAL = int(os.getenv("REFRESH_TEAMS_INTERVAL", 43200))
+
+    # Game lists on the Games page: games per page (each renders as a summary row or full card)
+    GAMES_PAGE_SIZE = int(os.getenv("GAMES_PAGE_SIZE", 10))
+
+    # Live-score polling on the Games page
+    LIVE_POLL_INTERVAL = int(os.getenv("LIVE_POLL_INTERVAL", 20))          # seconds between window polls
+    SEASON_RELOAD_INTERVAL = int(os.getenv("SEASON_RELOAD_INTERVAL", 900)) # full-season re-parse
+
+    # "All Teams" roster loading on the Players page
+    ROSTER_FANOUT_WORKERS = int(os.getenv("ROSTER_FANOUT_WORKERS", 8))
+    ROSTER_FANOUT_DEADLINE = float(os.getenv("ROSTER_FANOUT_DEADLINE", 20))   # seconds
+
     NFL_LEAGUE_ID = 1
     NCAA_LEAGUE_ID = 2
 
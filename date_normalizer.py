@@ -0,0 +1,86 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+NAT_INT = np.iinfo(np.int64).min
+
+# Trailing "Z", "+02:00" or "-0400" on an ISO string.
+_TZ_SUFFIX = re.compile(r"(?:[Zz]|[+-]\d\d:?\d\d)$")
+
+# Epoch seconds pandas can represent as a Timestamp; others (e.g. milliseconds) become NaT.
+EPOCH_MIN = pd.Timestamp.min.ceil("s").value // 10**9
+EPOCH_MAX = pd.Timestamp.max.floor("s").value // 10**9
+
+
+def _is_number(value) -> bool:
+    """
+    Epoch-shaped value: a number, or a digit string of 9-10 digits (epoch
+    seconds since 1973). Shorter ones such as "20240908" are compact ISO dates.
+    """
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    return isinstance(value, str) and value.isdigit() and 9 <= len(value) <= 10
+
+
+def normalize_dates(sections):
+    """
+    Convert a payload's worth of API date sections to UTC kickoffs in one go.
+
+    Each section is classified by shape (epoch number, {"timestamp"},
+    {"date", "time"}, {"date"}, a dict holding an ISO string, or an ISO /
+    "%Y-%m-%d %H:%M" string); each group is then converted in a single
+    vectorized pass. Naive values are taken as UTC.
+
+    Returns (datetime64[s] array with NaT for unrecognised or out-of-range
+    values, count of NaT).
+    """
+    n = len(sections)
+    epoch_rows, epoch_values = [], []
+    aware_rows, aware_values = [], []
+    naive_rows, naive_values = [], []
+
+    for i, section in enumerate(sections):
+        if not section:
+            continue
+        if isinstance(section, dict):
+            ts = section.get("timestamp")
+            if ts and _is_number(ts):
+                epoch_rows.append(i)
+                epoch_values.append(ts)
+                continue
+            d, t = section.get("date"), section.get("time")
+            if isinstance(d, str) and d:
+                section = f"{d}T{t}" if isinstance(t, str) and t else d
+            else:
+                section = next((v for v in section.values() if isinstance(v, str) and v[:1].isdigit()), None)
+                if section is None:
+                    continue
+        elif _is_number(section):
+            epoch_rows.append(i)
+            epoch_values.append(section)
+            continue
+        elif not isinstance(section, str):
+            continue
+        # pandas carries one string's offset over to later naive strings, so parse them apart.
+        if _TZ_SUFFIX.search(section):
+            aware_rows.append(i)
+            aware_values.append(section)
+        else:
+            naive_rows.append(i)
+            naive_values.append(section)
+
+    seconds = np.full(n, NAT_INT, dtype=np.int64)
+    if epoch_rows:
+        values = pd.to_numeric(pd.Series(epoch_values), errors="coerce").to_numpy(dtype=float)
+        ok = np.isfinite(values) & (values >= EPOCH_MIN) & (values <= EPOCH_MAX)
+        seconds[np.asarray(epoch_rows)[ok]] = values[ok].astype(np.int64)
+    for rows, values in ((aware_rows, aware_values), (naive_rows, naive_values)):
+        if rows:
+            parsed = pd.to_datetime(pd.Series(values), utc=True, format="ISO8601", errors="coerce")
+            seconds[rows] = parsed.to_numpy(dtype="datetime64[s]").view(np.int64)   # NaT stays int64 min
+
+    kickoffs = seconds.view("datetime64[s]")
+    return kickoffs, int(np.isnat(kickoffs).sum())
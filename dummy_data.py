@@ -56,6 +56,9 @@ NCAA_TEAMS = [
     {"id": 110, "name": "Oregon Ducks", "code": "ORE", "logo": "https://a.espncdn.com/i/teamlogos/ncaa/500/2483.png", "conference": "Pac-12", "division": "North"}
 ]
 
+# The API's standings name the NFL conferences in full
+CONFERENCE_NAMES = {"AFC": "American Football Conference", "NFC": "National Football Conference"}
+
 # Dummy data for players
 PLAYERS = [
     {"id": 1, "name": "Patrick Mahomes", "firstname": "Patrick", "lastname": "Mahomes", "age": 28, "birth_date": "1995-09-17", "nationality": "USA", "height": "6'3\"", "weight": "230 lbs", "position": "QB", "number": 15, "team_id": 1, "team_name": "Kansas City Chiefs", "team_logo": "https://a.espncdn.com/i/teamlogos/nfl/500/kc.png", "injured": False, "photo": "https://a.espncdn.com/i/headshots/nfl/players/full/3139477.png"},
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from date_normalizer import normalize_dates
+from models import Game as GameModel
+
+
+def raw_game_id(raw: dict):
+    """
+    API game id of a raw game, used to fetch odds with /odds?game=ID.
+    Looks for raw['game']['id'] or raw['id'] or raw['fixture']['id'].
+    """
+    gid = None
+    if isinstance(raw.get("game"), dict):
+        gid = raw["game"].get("id")
+    if gid is None:
+        gid = raw.get("id") or raw.get("fixture", {}).get("id")
+    return gid
+
+
+def parse_games(api_response):
+    """
+    Robust parsing of various API shapes. Returns list of GameModel instances.
+    Kickoff dates are normalized for the whole payload in one batch.
+    """
+    games = []
+    date_sections = []
+    for raw in api_response:
+        try:
+            teams = raw.get("teams") or {}
+            home = teams.get("home", {}) if isinstance(teams, dict) else {}
+            away = teams.get("away", {}) if isinstance(teams, dict) else {}
+            scores = raw.get("scores") or raw.get("score") or {}
+
+            venue_section = (raw.get("game") or {}).get("venue") or raw.get("venue") or {}
+            venue = ""
+            if isinstance(venue_section, dict):
+                venue = f"{venue_section.get('name', 'Unknown')}, {venue_section.get('city','')}".strip(", ")
+            elif isinstance(venue_section, str):
+                venue = venue_section
+
+            date_section = (raw.get("game") or {}).get("date") or raw.get("date") or raw.get("fixture", {}).get("date")
+            week = (raw.get("game") or {}).get("week") or (raw.get("league") or {}).get("round")
+
+            status = (raw.get("game") or {}).get("status", {}) or raw.get("status", {})
+            if isinstance(status, dict):
+                status_short = status.get("short") or status.get("long") or "N/A"
+            else:
+                status_short = str(status or "N/A")
+
+            home_name = home.get("name") or home.get("team", {}).get("name") or "N/A"
+            away_name = away.get("name") or away.get("team", {}).get("name") or "N/A"
+            home_logo = home.get("logo") or home.get("team", {}).get("logo")
+            away_logo = away.get("logo") or away.get("team", {}).get("logo")
+
+            home_total = None
+            away_total = None
+            try:
+                home_total = scores.get("home", {}).get("total") if isinstance(scores, dict) else None
+            except Exception:
+                pass
+            try:
+                away_total = scores.get("away", {}).get("total") if isinstance(scores, dict) else None
+            except Exception:
+                pass
+
+            games.append(GameModel(
+                home_team=home_name,
+                away_team=away_name,
+                home_score=home_total,
+                away_score=away_total,
+                venue=venue or "Unknown",
+                date="",  # filled in below from the batch normalization
+                status=(status_short or "N/A"),
+                scores=scores or {},
+                home_logo=home_logo,
+                away_logo=away_logo,
+                game_id=raw_game_id(raw),
+                week=str(week) if week else None,
+            ))
+            date_sections.append(date_section)
+        except Exception as e:
+            st.error(f"Error parsing game data: {e}")
+            continue
+
+    kickoffs, unrecognised = normalize_dates(date_sections)
+    if unrecognised:
+        st.caption(f"🕒 {unrecognised} game(s) have no recognised kickoff time and are listed as TBD")
+    iso_dates = np.datetime_as_string(kickoffs, unit="s")
+    aware = pd.DatetimeIndex(kickoffs).tz_localize("UTC").to_pydatetime()
+    for i in np.flatnonzero(~np.isnat(kickoffs)):
+        games[i].date = iso_dates[i] + "Z"
+        games[i].parsed_date = aware[i]
+    return games
@@ -0,0 +1,124 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Sort key for games without a kickoff (they go last within their week).
+NO_KICKOFF = float("inf")
+
+
+class StatusBuckets:
+    """
+    A list of Game objects with their status as one categorical column, built
+    once per change of the games. `mask_status` selects a status bucket (e.g.
+    live games) as a vectorized mask and `rows(mask)` maps it back to the
+    Game objects, in list order. Date windows and weeks are KickoffIndex's.
+    """
+
+    def __init__(self, games):
+        self.games = list(games)
+        self.status = pd.Categorical([(g.status or "").upper() for g in self.games])
+
+    def __len__(self):
+        return len(self.games)
+
+    def mask_status(self, *statuses) -> np.ndarray:
+        """Rows whose (upper-cased) status is one of `statuses`."""
+        categories = self.status.categories
+        codes = [categories.get_loc(s) for s in statuses if s in categories]
+        return np.isin(self.status.codes, codes)
+
+    def rows(self, mask: np.ndarray):
+        return [self.games[i] for i in np.flatnonzero(mask)]
+
+
+def kickoff_ts(game):
+    return int(game.parsed_date.timestamp()) if game.parsed_date else None
+
+
+class _SortedKeys:
+    """Keys kept in kickoff order in two parallel lists; bisect works on the times only."""
+
+    __slots__ = ("times", "keys")
+
+    def __init__(self, pairs=()):
+        pairs = sorted(pairs, key=lambda p: p[0])
+        self.times = [t for t, _ in pairs]
+        self.keys = [k for _, k in pairs]
+
+    def add(self, ts, key):
+        i = bisect_right(self.times, ts)
+        self.times.insert(i, ts)
+        self.keys.insert(i, key)
+
+    def remove(self, ts, key):
+        i = bisect_left(self.times, ts)
+        while self.keys[i] != key:
+            i += 1
+        del self.times[i]
+        del self.keys[i]
+
+    def between(self, lo, hi, after=False):
+        first = bisect_right(self.times, lo) if after else bisect_left(self.times, lo)
+        return self.keys[first:bisect_right(self.times, hi)]
+
+
+class KickoffIndex:
+    """
+    Game keys sorted by kickoff (epoch seconds), for O(log n + k) date-window
+    queries, plus a week label -> keys lookup in kickoff order. Entries are
+    upserted one at a time as live updates change or add games; games
+    without a kickoff are only reachable through their week.
+    """
+
+    def __init__(self, entries=()):
+        """`entries`: iterable of (key, kickoff_ts or None, week label or None)."""
+        self._entries = {key: (ts, week) for key, ts, week in entries}
+        self._all = _SortedKeys((ts, key) for key, (ts, _) in self._entries.items() if ts is not None)
+        by_week = {}
+        for key, (ts, week) in self._entries.items():
+            if week:
+                by_week.setdefault(week, []).append((NO_KICKOFF if ts is None else ts, key))
+        self._by_week = {week: _SortedKeys(pairs) for week, pairs in by_week.items()}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def upsert(self, key, ts, week):
+        old = self._entries.get(key)
+        if old == (ts, week):
+            return
+        if old is not None:
+            self._discard(key, *old)
+        self._entries[key] = (ts, week)
+        if ts is not None:
+            self._all.add(ts, key)
+        if week:
+            self._by_week.setdefault(week, _SortedKeys()).add(NO_KICKOFF if ts is None else ts, key)
+
+    def _discard(self, key, ts, week):
+        if ts is not None:
+            self._all.remove(ts, key)
+        if week:
+            bucket = self._by_week[week]
+            bucket.remove(NO_KICKOFF if ts is None else ts, key)
+            if not bucket.keys:
+                del self._by_week[week]
+
+    def between(self, start: datetime, end: datetime, after=False):
+        """
+        Keys kicking off in [start, end] (or (start, end] with `after`), in
+        kickoff order. Either bound may be None.
+        """
+        lo = start.timestamp() if start is not None else -NO_KICKOFF
+        hi = end.timestamp() if end is not None else NO_KICKOFF
+        return self._all.between(lo, hi, after)
+
+    def week(self, label):
+        bucket = self._by_week.get(label)
+        return list(bucket.keys) if bucket else []
+
+    def weeks(self):
+        """Week labels ordered by their first kickoff."""
+        return sorted(self._by_week, key=lambda w: (self._by_week[w].times[0], w))
@@ -0,0 +1,98 @@
+import json
+
+_WHITESPACE = " \t\n\r"
+_COMPACT_AT = 1 << 16
+
+
+class _Reader:
+    """Text buffer over an iterator of str chunks that drops consumed input."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                if self.pos > _COMPACT_AT:
+                    self.buf = self.buf[self.pos:]
+                    self.pos = 0
+                self.buf += chunk
+                return True
+        self.eof = True
+        return False
+
+    def peek(self, skip=_WHITESPACE) -> str:
+        """Next character after anything in `skip` ("" at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of JSON stream")
+        self.pos += 1
+
+    def decode(self, decoder):
+        """Decode one complete JSON value at the cursor, reading more input as needed."""
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+                # A number at the very end of the buffer may still be incomplete.
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+
+def iter_json_array(chunks, key: str = "response", envelope: dict = None):
+    """
+    Yield the elements of the top-level `key` array of a JSON object, one at a
+    time, from an iterable of text chunks. Only one element (plus one chunk)
+    is held in memory at once. Other top-level members are decoded whole and
+    stored into `envelope` if given, so callers can inspect e.g. "errors"
+    after (or while) iterating. Truncated input raises ValueError.
+    """
+    decoder = json.JSONDecoder()
+    reader = _Reader(chunks)
+    reader.expect("{")
+    while True:
+        char = reader.peek(_WHITESPACE + ",")
+        if char == "}":
+            return
+        if char == "":
+            raise ValueError("Unterminated object in JSON stream")
+        name = reader.decode(decoder)
+        reader.expect(":")
+        reader.peek()
+        if name != key:
+            value = reader.decode(decoder)
+            if envelope is not None:
+                envelope[name] = value
+            continue
+        if reader.peek() != "[":
+            # e.g. "response": {} on some error payloads
+            value = reader.decode(decoder)
+            if envelope is not None:
+                envelope[name] = value
+            continue
+        reader.pos += 1
+        while True:
+            char = reader.peek(_WHITESPACE + ",")
+            if char == "]":
+                reader.pos += 1
+                break
+            if char == "":
+                raise ValueError("Unterminated array in JSON stream")
+            yield reader.decode(decoder)
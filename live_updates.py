@@ -0,0 +1,151 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from config import Config
+from game_table import KickoffIndex, StatusBuckets, kickoff_ts
+
+# Statuses after which a game will not change again.
+FINAL_STATUSES = {"FT", "AOT", "CANC", "PST", "AWD", "ABD"}
+
+# No game is still in progress this long after kickoff.
+MAX_GAME_DURATION = timedelta(hours=8)
+
+
+def _fingerprint(game):
+    # Kickoff and week included: a rescheduled game must move in the KickoffIndex.
+    return (game.status, game.home_score, game.away_score, repr(game.scores), game.parsed_date, game.week)
+
+
+class LiveScoreEngine:
+    """
+    Keeps one league/season parsed in memory and refreshes only the games
+    that can be in progress.
+
+    The full season is parsed on first use and again every
+    SEASON_RELOAD_INTERVAL seconds (to pick up schedule changes). In between,
+    `sync` polls /games (at most every LIVE_POLL_INTERVAL seconds) for just
+    the date window spanning games that kicked off recently without a final
+    status, merges the results by game id and records which games changed.
+    A KickoffIndex over the games (kept up to date on every merge) answers
+    date-window and week queries.
+
+    An engine built with `from_games` (a finished season loaded from a
+    snapshot) is frozen: `sync` never reloads or polls it.
+    """
+
+    def __init__(self, league: int, season: int, parse_fn):
+        self.league = league
+        self.season = season
+        self.parse_fn = parse_fn
+        self.frozen = False
+        self.games = {}
+        self.last_changed = set()
+        self.load_error = None
+        self._buckets = None
+        self.index = KickoffIndex()
+        self._loaded_at = None
+        self._polled_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_games(cls, league: int, season: int, games):
+        engine = cls(league, season, parse_fn=None)
+        engine._replace(games)
+        engine.frozen = True
+        return engine
+
+    def status_buckets(self) -> StatusBuckets:
+        """The season's games by status, rebuilt only after the games change."""
+        with self._lock:
+            if self._buckets is None:
+                self._buckets = StatusBuckets(self.games.values())
+            return self._buckets
+
+    def between(self, start: datetime = None, end: datetime = None, after=False):
+        """Games kicking off in [start, end] (or (start, end] with `after`), in kickoff order."""
+        with self._lock:
+            return [self.games[k] for k in self.index.between(start, end, after)]
+
+    def weeks(self):
+        with self._lock:
+            return self.index.weeks()
+
+    def week_games(self, week: str):
+        with self._lock:
+            return [self.games[k] for k in self.index.week(week)]
+
+    def sync(self, client, now: datetime = None):
+        """Bring the in-memory season up to date; returns the ids that changed."""
+        now = now or datetime.now(timezone.utc)
+        if self.frozen:
+            return set()
+        with self._lock:
+            mono = time.monotonic()
+            if self._loaded_at is None or mono - self._loaded_at > Config.SEASON_RELOAD_INTERVAL:
+                # A failed or empty load is retried on the next rerun.
+                if self._load(client) and self.games:
+                    self._loaded_at = mono
+                self._polled_at = mono
+            elif mono - self._polled_at >= Config.LIVE_POLL_INTERVAL:
+                self.last_changed = self._poll(client, now)
+                self._polled_at = mono
+            return self.last_changed
+
+    def _load(self, client) -> bool:
+        """
+        Re-parse the full season. If the request fails (also mid-stream) the
+        previous games are kept and the error is left in `load_error`.
+        """
+        try:
+            # Streamed: raw game dicts are parsed as they arrive
+            parsed = self.parse_fn(client.iter_games(league=self.league, season=self.season))
+        except Exception as e:
+            self.load_error = e
+            self.last_changed = set()
+            return False
+        self.load_error = None
+        previous = self.games
+        self._replace(parsed)
+        self.last_changed = {
+            k for k, g in self.games.items()
+            if k not in previous or _fingerprint(previous[k]) != _fingerprint(g)
+        } if previous else set()
+        return True
+
+    def _replace(self, games):
+        self.games = {self._key(g, ("row", i)): g for i, g in enumerate(games)}
+        self.index = KickoffIndex((k, kickoff_ts(g), g.week) for k, g in self.games.items())
+        self._buckets = None
+
+    def in_progress(self, now: datetime):
+        """Games kicked off within MAX_GAME_DURATION that have no final status yet."""
+        return [
+            self.games[k] for k in self.index.between(now - MAX_GAME_DURATION, now)
+            if (self.games[k].status or "").upper() not in FINAL_STATUSES
+        ]
+
+    def _poll(self, client, now: datetime):
+        window = self.in_progress(now)
+        if not window:
+            return set()
+        date_from = window[0].parsed_date.strftime("%Y-%m-%d")  # kickoff order
+        date_to = now.strftime("%Y-%m-%d")
+        raw = client.get_games(league=self.league, season=self.season, date_from=date_from, date_to=date_to)
+        changed = set()
+        for g in self.parse_fn(raw):
+            key = self._key(g, None)
+            if key is None:
+                continue
+            old = self.games.get(key)
+            if old is None or _fingerprint(old) != _fingerprint(g):
+                self.games[key] = g
+                self.index.upsert(key, kickoff_ts(g), g.week)
+                changed.add(key)
+        if changed:
+            self._buckets = None
+        return changed
+
+    @staticmethod
+    def _key(game, fallback):
+        return game.game_id if game.game_id is not None else fallback
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Multi-session load test for the dashboard pages.
+
+Drives simulated user sessions through the Games, Standings and Players page
+scripts with Streamlit's AppTest, against an in-process stub_server (so no
+API quota is used). Sessions switch leagues and seasons, open odds views and
+player profiles. Reports p50/p95/p99 rerun time per page, upstream call
+counts per endpoint and total RSS over time.
+
+AppTest swaps process-global state (the Streamlit runtime, st.secrets) on
+every run, so sessions cannot run concurrently in threads. They run in
+--concurrency worker processes instead: each worker behaves like one app
+replica (its st.cache_resource state is shared by the sessions it plays)
+and all workers share the stub and the persistent response cache.
+
+Usage:
+    python loadtest.py --sessions 20 --concurrency 4 --latency 80 --jitter 30
+    python loadtest.py --pages games --cold --json loadtest.json
+"""
+
+import argparse
+import glob
+import multiprocessing
+import json
+import math
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+PAGES = {
+    "games": "pages/1_*Games.py",
+    "standings": "pages/2_*Standings.py",
+    "players": "pages/4_*Players.py",
+}
+
+
+def _page_path(name):
+    return glob.glob(os.path.join(HERE, PAGES[name]))[0]
+
+
+def rss_mb(pid="self") -> float:
+    """Resident set size of `pid` in MB (own peak RSS where /proc is unavailable)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        if pid != "self":
+            return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def total_rss_mb() -> float:
+    """RSS of this process plus its live worker processes."""
+    return rss_mb() + sum(rss_mb(child.pid) for child in multiprocessing.active_children())
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values` (pct in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class RSSSampler(threading.Thread):
+    def __init__(self, interval: float):
+        super().__init__(name="rss-sampler", daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._halt = threading.Event()
+        self._t0 = time.monotonic()
+
+    def run(self):
+        while not self._halt.is_set():
+            self.samples.append((round(time.monotonic() - self._t0, 2), round(total_rss_mb(), 1)))
+            self._halt.wait(self.interval)
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+        self.samples.append((round(time.monotonic() - self._t0, 2), round(total_rss_mb(), 1)))
+
+
+class Results:
+    """Rerun timings and error counts per page."""
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, page, seconds, errors=0):
+        self.timings[page].append(seconds)
+        self.errors[page] += errors
+
+    def record_failure(self, page):
+        self.errors[page] += 1
+
+    def merge(self, other):
+        for page, seconds in other.timings.items():
+            self.timings[page].extend(seconds)
+        for page, count in other.errors.items():
+            self.errors[page] += count
+
+
+class Session:
+    """One simulated user: a random walk over a page's controls."""
+
+    def __init__(self, page: str, rng: random.Random, results: Results, timeout: float):
+        from streamlit.testing.v1 import AppTest
+
+        self.page = page
+        self.rng = rng
+        self.results = results
+        self.at = AppTest.from_file(_page_path(page), default_timeout=timeout)
+        # Pages read league ids via st.secrets, which raises without a secrets.toml.
+        self.at.secrets["NFL_LEAGUE_ID"] = int(os.environ.get("NFL_LEAGUE_ID", 1))
+        self.at.secrets["NCAA_LEAGUE_ID"] = int(os.environ.get("NCAA_LEAGUE_ID", 2))
+
+    def _run(self, action):
+        start = time.perf_counter()
+        action()
+        self.results.record(self.page, time.perf_counter() - start, len(self.at.exception))
+
+    def _pick_sidebar(self, label):
+        """Rerun action that picks a random option of a sidebar selectbox."""
+        for box in self.at.sidebar.selectbox:
+            if box.label == label and box.options:
+                return box.select(self.rng.choice(box.options)).run
+        return self.at.run
+
+    def play(self, steps: int):
+        self._run(self.at.run)
+        for _ in range(steps):
+            getattr(self, f"_step_{self.page}")()
+
+    def _step_games(self):
+        choice = self.rng.random()
+        odds_views = [b for b in self.at.selectbox if (b.key or "").startswith("bm_")]
+        details = [t for t in self.at.toggle if (t.key or "").startswith("open_") and not t.value]
+        if odds_views and choice < 0.35:
+            box = self.rng.choice(odds_views)
+            self._run(box.select(self.rng.choice(box.options)).run)
+        elif details and choice < 0.5:
+            # Odds views only render once a game's Details toggle is on.
+            self._run(self.rng.choice(details).set_value(True).run)
+        elif choice < 0.75:
+            self._run(self._pick_sidebar("Select League"))
+        else:
+            self._run(self._pick_sidebar("Select Season"))
+
+    def _step_standings(self):
+        label = "Select League" if self.rng.random() < 0.5 else "Select Season"
+        self._run(self._pick_sidebar(label))
+
+    def _step_players(self):
+        back = [b for b in self.at.button if b.label.startswith("⬅️")]
+        profiles = [b for b in self.at.button if (b.key or "").startswith("profile_")]
+        if back:
+            self._run(back[0].click().run)
+        elif profiles and self.rng.random() < 0.6:
+            self._run(self.rng.choice(profiles).click().run)
+        else:
+            label = "League" if self.rng.random() < 0.5 else "Season"
+            self._run(self._pick_sidebar(label))
+
+
+def _init_worker():
+    from streamlit import config
+    from streamlit.logger import set_log_level
+
+    sys.path.insert(0, HERE)
+    # AppTest runs without a server, so Streamlit warns about a missing ScriptRunContext on every
+    # cache call. Load the config first: parsing it resets the log level.
+    config.get_config_options()
+    set_log_level("error")
+
+
+def run_session(plan) -> Results:
+    """Play one session in a worker process; returns its timings."""
+    page, seed, steps, timeout = plan
+    results = Results()
+    try:
+        Session(page, random.Random(seed), results, timeout).play(steps)
+    except Exception:
+        results.record_failure(page)
+        traceback.print_exc()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session AppTest load test against a local stub API")
+    parser.add_argument("--pages", default="games,standings,players", help="comma separated: " + ",".join(PAGES))
+    parser.add_argument("--sessions", type=int, default=10, help="simulated sessions per page")
+    parser.add_argument("--steps", type=int, default=5, help="interactions per session after the first run")
+    parser.add_argument("--concurrency", type=int, default=4, help="worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=50.0, help="stub latency (ms)")
+    parser.add_argument("--jitter", type=float, default=20.0, help="stub jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--cold", action="store_true", help="disable the persistent response cache")
+    parser.add_argument("--refresher", action="store_true", help="keep the background refresher running")
+    parser.add_argument("--timeout", type=float, default=60.0, help="AppTest per-run timeout (s)")
+    parser.add_argument("--rss-interval", type=float, default=1.0)
+    parser.add_argument("--json", dest="json_path", help="also write the report here")
+    args = parser.parse_args()
+
+    from stub_server import StubAPIServer
+
+    stub = StubAPIServer(("127.0.0.1", 0), seed=args.seed, latency_ms=args.latency,
+                         jitter_ms=args.jitter, error_rate=args.error_rate).start()
+
+    # Config is read at import time, so point it at the stub before any worker imports a page.
+    os.environ["API_SPORTS_BASE_URL"] = stub.base_url
+    os.environ["API_SPORTS_KEY"] = "loadtest"
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false" if args.cold else "true"
+    scratch = tempfile.mkdtemp(prefix="loadtest-")
+    os.environ["RESPONSE_CACHE_PATH"] = os.path.join(scratch, "cache.sqlite3")
+    os.environ["ODDS_HISTORY_PATH"] = os.path.join(scratch, "odds_history.sqlite3")
+    os.environ["REFRESHER_ENABLED"] = "true" if args.refresher else "false"
+    os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "100000")
+
+    pages = [p.strip() for p in args.pages.split(",") if p.strip()]
+    rng = random.Random(args.seed)
+    plans = [(page, rng.random(), args.steps, args.timeout) for page in pages for _ in range(args.sessions)]
+    rng.shuffle(plans)
+
+    # AppTest replaces sys.modules["__main__"] with the page script inside workers, so hand the
+    # pool functions by their importable module name rather than as __main__ attributes.
+    import loadtest
+
+    results = Results()
+    sampler = RSSSampler(args.rss_interval)
+    sampler.start()
+    started = time.perf_counter()
+    # spawn: workers must not inherit the stub's serving thread or a half-initialised Streamlit.
+    with ProcessPoolExecutor(max_workers=args.concurrency, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=loadtest._init_worker) as pool:
+        for session_results in pool.map(loadtest.run_session, plans):
+            results.merge(session_results)
+    wall = time.perf_counter() - started
+    sampler.stop()
+    stub.stop()
+
+    timings, errors = results.timings, results.errors
+    report = {
+        "sessions_per_page": args.sessions,
+        "concurrency": args.concurrency,
+        "wall_seconds": round(wall, 2),
+        "pages": {
+            page: {
+                "reruns": len(timings[page]),
+                "errors": errors[page],
+                "p50_ms": round(percentile(timings[page], 50) * 1000, 1) if timings[page] else None,
+                "p95_ms": round(percentile(timings[page], 95) * 1000, 1) if timings[page] else None,
+                "p99_ms": round(percentile(timings[page], 99) * 1000, 1) if timings[page] else None,
+            }
+            for page in pages
+        },
+        "upstream_calls": dict(stub.counts),
+        "rss_mb": sampler.samples,
+    }
+
+    print(f"\n🏈 Load test: {args.sessions} sessions/page, concurrency {args.concurrency}, {wall:.1f}s wall")
+    print(f"{'page':<10} {'reruns':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for page, row in report["pages"].items():
+        print(f"{page:<10} {row['reruns']:>7} {row['errors']:>7} {row['p50_ms']!s:>9} {row['p95_ms']!s:>9} {row['p99_ms']!s:>9}")
+    print("upstream calls:", ", ".join(f"{k}={v}" for k, v in sorted(stub.counts.items())))
+    rss = [mb for _, mb in sampler.samples]
+    print(f"RSS MB: start {rss[0]}, peak {max(rss)}, end {rss[-1]}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 
-@dataclass
+
+def parse_iso_utc(value: str) -> Optional[datetime]:
+    """Safely parse an ISO date with Zulu UTC support (naive values are taken as UTC)."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
 class Game:
+    """
+    One game as the pages use it. Slotted, since a season keeps thousands
+    in memory; the kickoff is parsed once into parsed_date.
+    """
     home_team: str
     away_team: str
     home_score: Optional[int]
@@ -15,6 +32,15 @@ class Game:
     scores: Dict
     home_logo: Optional[str] = None
     away_logo: Optional[str] = None
+    game_id: Optional[int] = None
+    week: Optional[str] = None  # e.g. "Week 5" (API game.week / league.round)
+    # Kickoff as an aware UTC datetime; None if missing/invalid. Parsed once from `date`
+    # unless the caller already has it (e.g. from a batch normalization).
+    parsed_date: Optional[datetime] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.parsed_date is None:
+            self.parsed_date = parse_iso_utc(self.date)
 
     @staticmethod
     def from_api_data(data):
@@ -42,19 +68,10 @@ class Game:
             status=data.get("status", {}).get("short", "N/A"),
             scores=scores,
             home_logo=home.get("logo"),
-            away_logo=away.get("logo")
+            away_logo=away.get("logo"),
+            game_id=(data.get("game") or {}).get("id") or data.get("id")
         )
 
-    @property
-    def parsed_date(self) -> Optional[datetime]:
-        """Safely parse ISO date with Zulu UTC support."""
-        if not self.date:
-            return None
-        try:
-            return datetime.fromisoformat(self.date.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-        
 
 @dataclass
 class Standing:
@@ -163,4 +180,51 @@ class DataProcessor:
             "GA": s.all_goals_against,
             "GD": s.goals_diff,
             "Points": s.points
-        } for s in standings])
\ No newline at end of file
+        } for s in standings])
+
+    # Columns of the standings table, in display order.
+    STANDINGS_COLUMNS = ["Rank", "Team", "Conference", "Played", "Wins", "Draws", "Losses", "GF", "GA", "GD", "Points"]
+
+    @staticmethod
+    def standings_frame(entries) -> pd.DataFrame:
+        """
+        Raw /standings entries -> one typed DataFrame in a single pass (same
+        field mapping as Standing.from_api_data), with Played, GD/Points and
+        Win % computed column-wise.
+        """
+        columns = {name: [] for name in ("Rank", "Team", "Conference", "Logo", "Wins", "Draws", "Losses", "GF", "GA", "GD")}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            team = entry.get("team") if isinstance(entry.get("team"), dict) else {}
+            points = entry.get("points") if isinstance(entry.get("points"), dict) else {}
+            columns["Rank"].append(entry.get("position"))
+            columns["Team"].append(team.get("name", "N/A"))
+            columns["Conference"].append(entry.get("conference") or "-")
+            columns["Logo"].append(team.get("logo"))
+            columns["Wins"].append(entry.get("won"))
+            columns["Draws"].append(entry.get("ties"))
+            columns["Losses"].append(entry.get("lost"))
+            columns["GF"].append(points.get("for"))
+            columns["GA"].append(points.get("against"))
+            columns["GD"].append(points.get("difference"))
+
+        df = pd.DataFrame(columns)
+        counts = ["Rank", "Wins", "Draws", "Losses", "GF", "GA", "GD"]
+        df[counts] = df[counts].apply(pd.to_numeric, errors="coerce").fillna(0).astype("int64")
+        df["Conference"] = df["Conference"].astype("category")
+        df["Played"] = df["Wins"] + df["Draws"] + df["Losses"]
+        df["Points"] = df["GD"]
+        df["Win %"] = np.where(df["Played"] > 0, 100.0 * df["Wins"] / df["Played"].clip(lower=1), 0.0)
+        return df
+
+    @staticmethod
+    def conference_groups(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Per-conference slices of a standings frame, sorted by Points (descending)."""
+        groups = {}
+        for conference, group in df.groupby("Conference", observed=True, sort=True):
+            group = group.sort_values("Points", ascending=False, kind="stable")
+            group.index = [""] * len(group)  # st.table shows the index; keep it blank
+            groups[conference] = group
+        return groups
+
@@ -0,0 +1,99 @@
+import pandas as pd
+
+# A market is one line of one bet for one game: "Over 49.5" and "Under 49.5" share
+# (game_id, "Over/Under", 49.5). Handicaps are keyed from the home side: "Home -7.5"
+# and "Away +7.5" share line -7.5, while "Home +7.5" is a different market (+7.5).
+MARKET = ["game_id", "bet", "line"]
+
+_OPTION = r"^(?P<outcome>.*?)\s*(?P<line>[+-]?\d+(?:\.\d+)?)?$"
+
+
+def split_options(options: pd.Series):
+    """
+    Option labels -> (outcome, line) arrays; parsed once per distinct label.
+    An away handicap's sign is flipped so both sides of a spread share a line.
+    """
+    codes, labels = pd.factorize(options)
+    parts = pd.Series(labels, dtype=object).str.extract(_OPTION)
+    outcome = parts["outcome"].to_numpy(dtype=object)
+    line = pd.to_numeric(parts["line"], errors="coerce").fillna(0.0)
+    line = line.where(parts["outcome"].str.lower() != "away", -line).to_numpy()
+    return outcome[codes], line[codes]
+
+
+class MarketBoard:
+    """
+    Pricing analytics over a slate's long odds frame (see odds_table), all
+    computed with grouped vector operations:
+
+    - prices:   every valid quote with its outcome, line and implied probability
+    - margins:  per bookmaker and market, the book (sum of implied) and overround
+    - best:     best price per outcome across bookmakers, with the arbitrage stake share
+    - markets:  per market, the best-line book, average overround and arbitrage edge
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        prices = frame[frame["odd"] > 1.0]
+        outcome, line = split_options(prices["option"])
+        self.prices = prices.assign(outcome=outcome, line=line, implied=1.0 / prices["odd"])
+
+        margins = self.prices.groupby(MARKET + ["bookmaker"], observed=True).agg(
+            outcomes=("implied", "size"), book=("implied", "sum"))
+        margins["overround"] = (margins["book"] - 1.0).where(margins["outcomes"] >= 2)
+        self.margins = margins.reset_index()
+
+        best_rows = self.prices.groupby(MARKET + ["outcome"], observed=True)["odd"].idxmax()
+        best = self.prices.loc[best_rows.to_numpy(), MARKET + ["outcome", "odd", "bookmaker", "implied"]]
+        book = best.groupby(MARKET, observed=True)["implied"].transform("sum")
+        self.best = best.assign(stake_pct=100.0 * best["implied"] / book).reset_index(drop=True)
+
+        markets = self.best.groupby(MARKET, observed=True).agg(
+            outcomes=("implied", "size"), best_book=("implied", "sum"))
+        quotes = self.margins.groupby(MARKET, observed=True).agg(
+            bookmakers=("bookmaker", "size"), avg_overround=("overround", "mean"))
+        markets = markets.join(quotes)
+        markets["edge"] = (1.0 - markets["best_book"]).where(markets["outcomes"] >= 2)
+        markets["arbitrage"] = markets["edge"].gt(0)
+        self.markets = markets.reset_index()
+
+    @classmethod
+    def from_table(cls, odds_table) -> "MarketBoard":
+        return cls(odds_table.frame)
+
+    def __len__(self):
+        return len(self.markets)
+
+    def arbitrages(self) -> pd.DataFrame:
+        """Markets where backing every outcome at its best price guarantees a profit."""
+        return self.markets[self.markets["arbitrage"]].sort_values("edge", ascending=False)
+
+    def board(self, labels: dict = None) -> pd.DataFrame:
+        """
+        One display row per market: game label, market, best price per outcome
+        ("Home 2.10 · FanDuel"), average bookmaker margin and arbitrage edge (%).
+        Sorted by edge: arbitrage first, then the tightest markets. With
+        `labels` ({game_id: label}), only the labelled games are listed.
+        """
+        best = self.best
+        text = (best["outcome"].astype(str) + " " + best["odd"].map("{:.2f}".format)
+                + " · " + best["bookmaker"].astype(str))
+        stakes = best["outcome"].astype(str) + " " + best["stake_pct"].round(1).astype(str) + "%"
+        joined = pd.DataFrame({"prices": text, "stakes": stakes}).groupby(
+            [best[c] for c in MARKET], observed=True).agg(" | ".join)
+
+        m = self.markets.join(joined, on=MARKET)
+        if labels is not None:
+            m = m[m["game_id"].isin(list(labels))]
+        # astype(str): mapping an empty column keeps its float dtype
+        line = (" " + m["line"].map("{:g}".format).astype(str)).where(m["line"] != 0, "")
+        board = pd.DataFrame({
+            "Game": m["game_id"].map(labels) if labels is not None else m["game_id"],
+            "Market": m["bet"].astype(str) + line,
+            "Best prices": m["prices"],
+            "Books": m["bookmakers"],
+            "Avg margin %": (100.0 * m["avg_overround"]).round(2),
+            "Best-line book %": (100.0 * m["best_book"]).round(2),
+            "Arb edge %": (100.0 * m["edge"]).round(2),
+            "Arb stakes": m["stakes"].where(m["arbitrage"], ""),
+        })
+        return board.sort_values("Arb edge %", ascending=False, kind="stable").reset_index(drop=True)
@@ -0,0 +1,168 @@
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS odds_series (
+    id         INTEGER PRIMARY KEY,
+    game_id    INTEGER NOT NULL,
+    bookmaker  TEXT NOT NULL,
+    bet        TEXT NOT NULL,
+    option     TEXT NOT NULL,
+    last_odd   REAL,
+    updated_at INTEGER,
+    UNIQUE (game_id, bookmaker, bet, option)
+);
+CREATE TABLE IF NOT EXISTS odds_ticks (
+    series_id   INTEGER NOT NULL,
+    captured_at INTEGER NOT NULL,
+    odd         REAL NOT NULL,
+    PRIMARY KEY (series_id, captured_at)
+) WITHOUT ROWID;
+"""
+
+SERIES_KEY = ["game_id", "bookmaker", "bet", "option"]
+
+
+class OddsHistory:
+    """
+    Append-only price history for odds snapshots, stored in SQLite.
+
+    Each (game, bookmaker, bet, option) is a series stored once; a snapshot
+    appends a (series, captured_at, odd) tick only where the price differs
+    from the series' last stored price, so re-recording an unchanged slate
+    writes nothing. Ticks are clustered by series, so a game's line
+    movement is one indexed range read. Growth is bounded by dropping games
+    with no price change for `retention_days` and by keeping at most
+    `max_points` ticks per series.
+    """
+
+    PRUNE_INTERVAL = 3600   # seconds between automatic prunes after a record
+
+    def __init__(self, path: str, retention_days: float, max_points: int):
+        self.path = path
+        self.retention = retention_days * 86400
+        self.max_points = max_points
+        self._pruned_at = 0
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def record(self, frame: pd.DataFrame, captured_at: float = None) -> int:
+        """
+        Store one snapshot of a long odds frame (see odds_table); returns the
+        number of ticks appended.
+        """
+        now = int(captured_at if captured_at is not None else time.time())
+        quotes = frame.loc[frame["odd"].notna() & frame["game_id"].notna(), SERIES_KEY + ["odd"]]
+        quotes = quotes.drop_duplicates(SERIES_KEY)
+        if quotes.empty:
+            return 0
+        keys = list(zip(quotes["game_id"].astype(int), quotes["bookmaker"].astype(str),
+                        quotes["bet"].astype(str), quotes["option"].astype(str)))
+        odds = quotes["odd"].to_numpy(dtype=float)
+        game_ids = sorted({k[0] for k in keys})
+
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO odds_series (game_id, bookmaker, bet, option) VALUES (?, ?, ?, ?)", keys)
+            stored = {}
+            for chunk in range(0, len(game_ids), 500):
+                ids = game_ids[chunk:chunk + 500]
+                stored.update(
+                    ((g, b, t, o), (sid, last)) for sid, g, b, t, o, last in conn.execute(
+                        "SELECT id, game_id, bookmaker, bet, option, last_odd FROM odds_series "
+                        f"WHERE game_id IN ({','.join('?' * len(ids))})", ids))
+            series = np.array([stored[k][0] for k in keys], dtype=np.int64)
+            last = np.array([np.nan if stored[k][1] is None else stored[k][1] for k in keys], dtype=float)
+            changed = np.flatnonzero(~np.isclose(odds, last, rtol=0, atol=1e-9))
+            conn.executemany(
+                "INSERT OR REPLACE INTO odds_ticks (series_id, captured_at, odd) VALUES (?, ?, ?)",
+                [(int(series[i]), now, float(odds[i])) for i in changed])
+            conn.executemany(
+                "UPDATE odds_series SET last_odd = ?, updated_at = ? WHERE id = ?",
+                [(float(odds[i]), now, int(series[i])) for i in changed])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if now - self._pruned_at >= self.PRUNE_INTERVAL:
+            self._pruned_at = now
+            self.prune(now)
+        return len(changed)
+
+    def prune(self, now: float = None):
+        """Drop games idle past the retention window and ticks beyond `max_points` per series."""
+        cutoff = int((now if now is not None else time.time()) - self.retention)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stale = "SELECT game_id FROM odds_series GROUP BY game_id HAVING MAX(updated_at) < ?"
+            conn.execute(
+                f"DELETE FROM odds_ticks WHERE series_id IN "
+                f"(SELECT id FROM odds_series WHERE game_id IN ({stale}))", (cutoff,))
+            conn.execute(f"DELETE FROM odds_series WHERE game_id IN ({stale})", (cutoff,))
+            conn.execute(
+                "DELETE FROM odds_ticks WHERE (series_id, captured_at) IN ("
+                " SELECT series_id, captured_at FROM ("
+                "  SELECT series_id, captured_at,"
+                "         ROW_NUMBER() OVER (PARTITION BY series_id ORDER BY captured_at DESC) AS n"
+                "  FROM odds_ticks"
+                " ) WHERE n > ?"
+                ")",
+                (self.max_points,),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def movement(self, game_id) -> pd.DataFrame:
+        """All ticks of one game: captured_at (UTC), bookmaker, bet, option, odd; oldest first."""
+        rows = self._conn().execute(
+            "SELECT t.captured_at, s.bookmaker, s.bet, s.option, t.odd "
+            "FROM odds_series s JOIN odds_ticks t ON t.series_id = s.id "
+            "WHERE s.game_id = ? ORDER BY t.captured_at",
+            (int(game_id),),
+        ).fetchall()
+        df = pd.DataFrame(rows, columns=["captured_at", "bookmaker", "bet", "option", "odd"])
+        df["captured_at"] = pd.to_datetime(df["captured_at"], unit="s", utc=True)
+        return df
+
+    def stats(self) -> dict:
+        conn = self._conn()
+        series = conn.execute("SELECT COUNT(*), COUNT(DISTINCT game_id) FROM odds_series").fetchone()
+        ticks = conn.execute("SELECT COUNT(*) FROM odds_ticks").fetchone()[0]
+        return {"games": series[1], "series": series[0], "ticks": ticks}
+
+
+def line_chart_frame(ticks: pd.DataFrame, until=None) -> pd.DataFrame:
+    """
+    One bet's ticks as a step series per "bookmaker · option" column,
+    forward-filled (a series only has ticks where its price changed) and
+    extended to `until`.
+    """
+    if ticks.empty:
+        return pd.DataFrame()
+    wide = ticks.assign(line=ticks["bookmaker"] + " · " + ticks["option"]).pivot_table(
+        index="captured_at", columns="line", values="odd", aggfunc="last")
+    if until is not None and until > wide.index[-1]:
+        wide.loc[pd.Timestamp(until)] = np.nan
+    return wide.ffill()
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+import pandas as pd
+
+COLUMNS = ["game_id", "bookmaker", "bet", "option", "odd"]
+
+
+def odds_frame(odds_index: dict) -> pd.DataFrame:
+    """
+    Flatten {game_id: /odds entry} into one long row per quoted price:
+    game_id, bookmaker, bet, option, odd (decimal; NaN when unparseable).
+
+    bookmaker and bet are categoricals: bookmakers in first-seen order,
+    bets sorted by name, matching the order the odds panel lists them.
+    """
+    game_ids, bookmakers, bets, options, odds = [], [], [], [], []
+    for game_id, entry in odds_index.items():
+        for bm in (entry or {}).get("bookmakers") or []:
+            bm_name = bm.get("name", "Unknown")
+            for bet in bm.get("bets") or []:
+                bet_name = bet.get("name", "Bet")
+                for v in bet.get("values") or []:
+                    game_ids.append(game_id)
+                    bookmakers.append(bm_name)
+                    bets.append(bet_name)
+                    options.append(str(v.get("value", "")))
+                    odds.append(v.get("odd"))
+
+    return pd.DataFrame({
+        "game_id": pd.array(game_ids, dtype="Int64"),
+        "bookmaker": pd.Categorical(bookmakers, categories=pd.unique(pd.Series(bookmakers, dtype=object))),
+        "bet": pd.Categorical(bets),
+        "option": pd.Series(options, dtype=object),
+        "odd": pd.to_numeric(pd.Series(odds, dtype=object), errors="coerce").astype(float),
+    }, columns=COLUMNS)
+
+
+class OddsTable:
+    """
+    Long-format odds for a slate of games, built once per batched /odds
+    fetch. The bookmaker-comparison view of every market is one pivot over
+    the whole slate (rows: game, bet, option; columns: bookmakers), indexed
+    by (game, bet), so rendering a game's panel is a few row slices.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._rows = frame.groupby("game_id", sort=False).indices
+
+        firsts = frame.drop_duplicates(["game_id", "bookmaker"])
+        self._bookmakers = {}
+        for game_id, bookmaker in zip(firsts["game_id"], firsts["bookmaker"]):
+            self._bookmakers.setdefault(game_id, []).append(bookmaker)
+
+        self.wide = (frame.groupby(["game_id", "bet", "option", "bookmaker"], observed=True)["odd"]
+                     .first().unstack("bookmaker").rename_axis(columns=None).reset_index())
+        self._bet_rows = self.wide.groupby(["game_id", "bet"], observed=True).indices
+        self._bets = {}
+        for game_id, bet in self._bet_rows:
+            self._bets.setdefault(game_id, []).append(bet)
+
+    @classmethod
+    def from_index(cls, odds_index: dict) -> "OddsTable":
+        return cls(odds_frame(odds_index))
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __contains__(self, game_id):
+        return game_id in self._rows
+
+    def game(self, game_id) -> pd.DataFrame:
+        """One game's long rows (empty frame if it has no odds)."""
+        rows = self._rows.get(game_id)
+        return self.frame.iloc[rows if rows is not None else []]
+
+    def bookmakers(self, game_id) -> list:
+        """Bookmakers quoting this game, in payload order."""
+        return list(self._bookmakers.get(game_id, []))
+
+    def bets(self, game_id) -> list:
+        """Markets offered for this game, sorted by name."""
+        return list(self._bets.get(game_id, []))
+
+    def comparison(self, game_id, bet) -> pd.DataFrame:
+        """One market: a row per option (sorted), a column per bookmaker; NaN where not quoted."""
+        rows = self._bet_rows.get((game_id, bet))
+        if rows is None:
+            return pd.DataFrame()
+        return self.wide.iloc[rows][["option"] + self.bookmakers(game_id)].rename(columns={"option": "Option"})
+
+    def bookmaker_markets(self, game_id, bookmaker) -> dict:
+        """{bet name: Option/Odds frame} for one bookmaker, in the order it lists them."""
+        return bookmaker_markets(self.game(game_id), bookmaker)
+
+    def for_game(self, game_id) -> "GameOdds":
+        bets = self.bets(game_id)
+        return GameOdds(
+            bookmakers=self.bookmakers(game_id),
+            bets=bets,
+            comparison={bet: self.comparison(game_id, bet) for bet in bets},
+            rows=self.game(game_id),
+        )
+
+
+@dataclass
+class GameOdds:
+    """One game's slice of an OddsTable: everything its odds panel renders."""
+    bookmakers: List[str]
+    bets: List[str]
+    comparison: Dict[str, pd.DataFrame]   # bet -> OddsTable.comparison frame
+    rows: pd.DataFrame                    # the game's long rows
+
+    def bookmaker_markets(self, bookmaker) -> dict:
+        return bookmaker_markets(self.rows, bookmaker)
+
+
+def bookmaker_markets(game_odds: pd.DataFrame, bookmaker) -> dict:
+    """{bet name: Option/Odds frame} for one bookmaker, in the order it lists them."""
+    odds = game_odds[game_odds["bookmaker"] == bookmaker]
+    return {
+        bet: group[["option", "odd"]].set_axis(["Option", "Odds"], axis=1)
+        for bet, group in odds.groupby(odds["bet"].astype(object), sort=False)
+    }
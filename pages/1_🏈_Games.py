@@ -1,13 +1,22 @@
 # pages/1_🏈_Games.py
 
+import sqlite3
+
 import streamlit as st
 from datetime import datetime, timedelta, timezone
-import requests
 import pandas as pd
 
-from api_client import APISportsClient
+from api_client import get_api_client
+from background_refresher import start_background_refresher
 from config import Config
-from models import Game as GameModel  # your dataclass (with parsed_date property)
+from game_parser import parse_games
+from live_updates import LiveScoreEngine
+from models import Game as GameModel
+from odds_analytics import MarketBoard
+from odds_history import OddsHistory, line_chart_frame
+from odds_table import OddsTable
+from rate_limiter import PRIORITY_INTERACTIVE
+from season_snapshots import get_season_snapshot
 
 
 st.title("🏈 Games & Odds")
@@ -15,90 +24,58 @@ st.write("View NFL/NCAA games, live scores, schedules, stats, and betting odds")
 
 
 # ----------------- Helpers -----------------
-def _to_iso_from_section(date_section):
-    """Return an ISO Zulu string from different possible date_section shapes."""
-    if not date_section:
-        return ""
-    if isinstance(date_section, dict):
-        ts = date_section.get("timestamp")
-        if ts:
-            try:
-                return datetime.fromtimestamp(int(ts), tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            except Exception:
-                pass
-        d = date_section.get("date")
-        t = date_section.get("time")
-        if d and t:
-            if len(t.split(":")) == 2:
-                t = f"{t}:00"
-            return f"{d}T{t}Z"
-        if d:
-            return f"{d}T00:00:00Z"
-        for v in date_section.values():
-            if isinstance(v, str):
-                try:
-                    dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
-                    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-                except Exception:
-                    continue
-        return ""
-    if isinstance(date_section, (int, float)):
-        try:
-            return datetime.fromtimestamp(int(date_section), tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        except Exception:
-            return ""
-    if isinstance(date_section, str):
-        try:
-            dt = datetime.fromisoformat(date_section.replace("Z", "+00:00"))
-            return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        except Exception:
-            try:
-                dt = datetime.strptime(date_section, "%Y-%m-%d %H:%M")
-                return dt.replace(tzinfo=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            except Exception:
-                return date_section
-    return ""
+@st.cache_resource
+def get_odds_history():
+    """Process-wide odds price history; None when disabled or the file can't be opened."""
+    if not Config.ODDS_HISTORY_ENABLED:
+        return None
+    try:
+        return OddsHistory(Config.ODDS_HISTORY_PATH,
+                           retention_days=Config.ODDS_HISTORY_RETENTION_DAYS,
+                           max_points=Config.ODDS_HISTORY_MAX_POINTS)
+    except (OSError, sqlite3.Error) as e:
+        st.warning(f"Odds history disabled: {e}")
+        return None
 
 
-def attach_game_id(game_obj: GameModel, raw: dict) -> None:
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
+def fetch_odds_table(league_id: int, season: int, dates: tuple) -> OddsTable:
     """
-    Attach API game id to the Game object so we can fetch odds with /odds?game=ID.
-    Looks for raw['game']['id'] or raw['id'] or raw['fixture']['id'].
+    Odds for every game on the given UTC dates, normalized into one long table.
+    Costs one /odds request per date instead of one per game, at interactive
+    priority since a user is waiting on it. Each fetch is also recorded as an
+    odds-history snapshot (changed prices only).
     """
-    gid = None
-    if isinstance(raw.get("game"), dict):
-        gid = raw["game"].get("id")
-    if gid is None:
-        gid = raw.get("id") or raw.get("fixture", {}).get("id")
-    setattr(game_obj, "game_id", gid)
+    client = get_api_client()
+    table = OddsTable.from_index(client.get_odds_by_game(league_id, season, dates,
+                                                         priority=PRIORITY_INTERACTIVE))
+    history = get_odds_history()
+    if history is not None:
+        try:
+            history.record(table.frame)
+        except sqlite3.Error:
+            pass  # history is best-effort; a locked file must not block the odds
+    return table
 
 
-@st.cache_data(show_spinner=False)
-def fetch_odds_cached(game_id: int, base_url: str, headers_items: tuple):
-    """
-    Cached request to GET /odds?game=<id>
-    headers_items must be a tuple(list(dict.items())) to be hashable; function rebuilds headers.
-    Returns:
-      - None if empty response
-      - {"errors": ...} if API returned errors
-      - {"_error": "..."} on request exception
-      - dict payload for that game otherwise
-    """
-    if not game_id:
-        return None
-    headers = dict(headers_items)
-    url = base_url.rstrip("/") + "/odds"
-    params = {"game": game_id}
-    try:
-        resp = requests.get(url, headers=headers, params=params, timeout=12)
-        resp.raise_for_status()
-        data = resp.json()
-        if data.get("errors"):
-            return {"errors": data.get("errors")}
-        arr = data.get("response", [])
-        return arr[0] if arr else None
-    except requests.RequestException as e:
-        return {"_error": str(e)}
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
+def fetch_market_board(league_id: int, season: int, dates: tuple) -> MarketBoard:
+    """Implied probabilities, margins, best lines and arbitrage over the cached odds table."""
+    return MarketBoard.from_table(fetch_odds_table(league_id, season, dates))
+
+
+def odds_dates(games) -> tuple:
+    """UTC kickoff dates covered by `games`, the key of the batched odds fetch."""
+    return tuple(sorted({g.parsed_date.strftime("%Y-%m-%d") for g in games if g.parsed_date}))
+
+
+def load_odds_table(games, league_id: int, season: int) -> OddsTable:
+    """Batched odds for the kickoff dates covered by `games`."""
+    dates = odds_dates(games)
+    if not dates:
+        return OddsTable.from_index({})
+    with st.spinner("Fetching odds..."):
+        return fetch_odds_table(league_id, season, dates)
 
 
 def format_dt(game: GameModel) -> str:
@@ -108,70 +85,16 @@ def format_dt(game: GameModel) -> str:
     return "TBD"
 
 
-# ----------------- Parsing -----------------
-def parse_games(api_response):
+@st.cache_resource
+def get_live_engine(league_id: int, season: int) -> LiveScoreEngine:
     """
-    Robust parsing of various API shapes. Returns list of GameModel instances.
+    One in-memory season per league/season, shared by all sessions. A
+    finished season with a snapshot is loaded from it and never polled.
     """
-    games = []
-    for raw in api_response:
-        try:
-            teams = raw.get("teams") or {}
-            home = teams.get("home", {}) if isinstance(teams, dict) else {}
-            away = teams.get("away", {}) if isinstance(teams, dict) else {}
-            scores = raw.get("scores") or raw.get("score") or {}
-
-            venue_section = (raw.get("game") or {}).get("venue") or raw.get("venue") or {}
-            venue = ""
-            if isinstance(venue_section, dict):
-                venue = f"{venue_section.get('name', 'Unknown')}, {venue_section.get('city','')}".strip(", ")
-            elif isinstance(venue_section, str):
-                venue = venue_section
-
-            date_section = (raw.get("game") or {}).get("date") or raw.get("date") or raw.get("fixture", {}).get("date")
-            iso_date = _to_iso_from_section(date_section)
-
-            status = (raw.get("game") or {}).get("status", {}) or raw.get("status", {})
-            if isinstance(status, dict):
-                status_short = status.get("short") or status.get("long") or "N/A"
-            else:
-                status_short = str(status or "N/A")
-
-            home_name = home.get("name") or home.get("team", {}).get("name") or "N/A"
-            away_name = away.get("name") or away.get("team", {}).get("name") or "N/A"
-            home_logo = home.get("logo") or home.get("team", {}).get("logo")
-            away_logo = away.get("logo") or away.get("team", {}).get("logo")
-
-            home_total = None
-            away_total = None
-            try:
-                home_total = scores.get("home", {}).get("total") if isinstance(scores, dict) else None
-            except Exception:
-                pass
-            try:
-                away_total = scores.get("away", {}).get("total") if isinstance(scores, dict) else None
-            except Exception:
-                pass
-
-            game_obj = GameModel(
-                home_team=home_name,
-                away_team=away_name,
-                home_score=home_total,
-                away_score=away_total,
-                venue=venue or "Unknown",
-                date=iso_date or "",
-                status=(status_short or "N/A"),
-                scores=scores or {},
-                home_logo=home_logo,
-                away_logo=away_logo,
-            )
-
-            attach_game_id(game_obj, raw)
-            games.append(game_obj)
-        except Exception as e:
-            st.error(f"Error parsing game data: {e}")
-            continue
-    return games
+    snapshot = get_season_snapshot(league_id, season)
+    if snapshot is not None and snapshot.has("games"):
+        return LiveScoreEngine.from_games(league_id, season, snapshot.games())
+    return LiveScoreEngine(league_id, season, parse_games)
 
 
 # ----------------- Utility to render HTML table w/out index -----------------
@@ -187,7 +110,7 @@ def show_table_no_index(df: pd.DataFrame):
 
 
 # ----------------- Display single game -----------------
-def display_game(game: GameModel, now_utc: datetime, show_odds=False, client: APISportsClient = None):
+def display_game(game: GameModel, now_utc: datetime, show_odds=False, odds: OddsTable = None):
     st.markdown("---")
     col1, col2, col3 = st.columns([3, 1, 3])
 
@@ -217,24 +140,11 @@ def display_game(game: GameModel, now_utc: datetime, show_odds=False, client: AP
         away_q = [str(game.scores.get("away", {}).get(f"quarter_{i}", 0)) for i in range(1, 5)]
         st.markdown(f"🏈 **Quarter Scores:** {', '.join(home_q)} — {', '.join(away_q)}")
 
-    # Odds section (lazy load on expand)
-    if show_odds and hasattr(game, "game_id") and client is not None:
+    # Odds section (served from the batched odds table)
+    if show_odds and game.game_id is not None and odds is not None:
         with st.expander("💰 Odds", expanded=False):
             try:
-                # Fetch only once (cached)
-                with st.spinner("Fetching odds..."):
-                    headers_items = tuple(sorted(client.headers.items()))
-                    odds_payload = fetch_odds_cached(getattr(game, "game_id"), client.base_url, headers_items)
-
-                if isinstance(odds_payload, dict) and odds_payload.get("_error"):
-                    st.warning(f"Error fetching odds: {odds_payload['_error']}")
-                    st.markdown("💰 **Odds:** Not yet released / API error")
-                    return
-                if isinstance(odds_payload, dict) and odds_payload.get("errors"):
-                    st.warning(f"Odds API returned errors: {odds_payload.get('errors')}")
-                    st.markdown("💰 **Odds:** Not yet released / API returned errors")
-                    return
-                if not odds_payload:
+                if game.game_id not in odds:
                     st.markdown("💰 **Odds:** Not yet released by bookmakers")
                     return
 
@@ -250,90 +160,191 @@ def display_game(game: GameModel, now_utc: datetime, show_odds=False, client: AP
                     st.markdown("💰 **Odds:** Not Available (pre-match window is 1–7 days before game)")
                     return
 
-                bookmakers = odds_payload.get("bookmakers", []) or []
-                if not bookmakers:
+                panel = odds.for_game(game.game_id)
+                if not panel.bookmakers:
                     st.markdown("💰 **Odds:** Not yet released by bookmakers")
                     return
-
-                # Build mapping bet_name -> {bookmaker -> {option: odd}}
-                bets_by_name = {}
-                bookies_order = []
-                for bm in bookmakers:
-                    bm_name = bm.get("name", "Unknown")
-                    bookies_order.append(bm_name)
-                    for bet in bm.get("bets", []) or []:
-                        bet_name = bet.get("name", "Bet")
-                        if bet_name not in bets_by_name:
-                            bets_by_name[bet_name] = {}
-                        bets_by_name[bet_name][bm_name] = {
-                            v.get("value", ""): v.get("odd", "N/A")
-                            for v in (bet.get("values", []) or [])
-                        }
-
-                # UI controls
-                compare_label = "Compare (All bookmakers)"
-                bookie_options = [compare_label] + bookies_order
-                selected_bookie = st.selectbox("Choose view", options=bookie_options, key=f"bm_{game.game_id}")
-
-                bet_names = sorted(list(bets_by_name.keys()))
-                bet_select_choices = ["All categories"] + bet_names
-                selected_bet = st.selectbox("Bet Category", options=bet_select_choices, key=f"bet_{game.game_id}")
-
-                # Render comparison
-                def render_comparison_table_for_bet(bet_name):
-                    bm_data = bets_by_name.get(bet_name, {})
-                    all_options = set()
-                    for odds_map in bm_data.values():
-                        all_options.update(odds_map.keys())
-                    all_options = sorted(all_options, key=lambda x: str(x))
-
-                    rows = []
-                    for opt in all_options:
-                        row = {"Option": opt}
-                        for bm in bookies_order:
-                            row[bm] = bm_data.get(bm, {}).get(opt, "-")
-                        rows.append(row)
-
-                    if rows:
-                        df = pd.DataFrame(rows)
-                        st.markdown(f"**{bet_name}**")
-                        show_table_no_index(df)
-                    else:
-                        st.markdown("_No options available for this market._")
-
-                def render_bookmaker_markets(bm_name):
-                    bm_block = next((b for b in bookmakers if b.get("name") == bm_name), None)
-                    if not bm_block:
-                        st.markdown("_Bookmaker data not found._")
-                        return
-                    for bet in bm_block.get("bets", []) or []:
-                        bet_name = bet.get("name", "Bet")
-                        rows = [{"Option": v.get("value", ""), "Odds": v.get("odd", "N/A")}
-                                for v in (bet.get("values", []) or [])]
-                        if rows:
-                            df = pd.DataFrame(rows)
-                            st.markdown(f"**{bet_name} — {bm_name}**")
-                            show_table_no_index(df)
-
-                if selected_bookie == compare_label:
-                    if selected_bet == "All categories":
-                        for bnm in bet_names:
-                            render_comparison_table_for_bet(bnm)
-                    else:
-                        render_comparison_table_for_bet(selected_bet)
-                else:
-                    render_bookmaker_markets(selected_bookie)
-
-                st.markdown("---")
-                st.markdown("**Bookmakers present:** " + ", ".join(bookies_order))
+                # The fragment reruns on its own, so it reads its odds from session state
+                st.session_state.setdefault("odds_panels", {})[game.game_id] = panel
+                odds_panel(game.game_id, now_utc)
 
             except Exception as e:
-                st.error(f"Error fetching odds: {e}")
+                st.error(f"Error rendering odds: {e}")
+
+
+@st.fragment
+def odds_panel(game_id, now_utc: datetime):
+    """
+    One game's bookmaker/market selectors and tables. Changing a selector
+    reruns only this fragment, not the page.
+    """
+    try:
+        panel = st.session_state.get("odds_panels", {}).get(game_id)
+        if panel is None:
+            st.markdown("💰 **Odds:** Not yet released by bookmakers")
+            return
+
+        # UI controls
+        compare_label = "Compare (All bookmakers)"
+        bookie_options = [compare_label] + panel.bookmakers
+        selected_bookie = st.selectbox("Choose view", options=bookie_options, key=f"bm_{game_id}")
+
+        bet_select_choices = ["All categories"] + panel.bets
+        selected_bet = st.selectbox("Bet Category", options=bet_select_choices, key=f"bet_{game_id}")
+
+        # Views are slices of the slate-wide comparison pivot / long table
+        if selected_bookie == compare_label:
+            for bet_name in (panel.bets if selected_bet == "All categories" else [selected_bet]):
+                df = panel.comparison[bet_name]
+                if df.empty:
+                    st.markdown("_No options available for this market._")
+                    continue
+                st.markdown(f"**{bet_name}**")
+                show_table_no_index(df)
+        else:
+            for bet_name, df in panel.bookmaker_markets(selected_bookie).items():
+                st.markdown(f"**{bet_name} — {selected_bookie}**")
+                show_table_no_index(df)
+
+        render_line_movement(game_id,
+                             panel.bets if selected_bet == "All categories" else [selected_bet],
+                             None if selected_bookie == compare_label else selected_bookie,
+                             now_utc)
+
+        st.markdown("---")
+        st.markdown("**Bookmakers present:** " + ", ".join(panel.bookmakers))
+
+    except Exception as e:
+        st.error(f"Error rendering odds: {e}")
+
+
+def render_line_movement(game_id, bets, bookmaker, now_utc: datetime):
+    """Price history charts for the prices of this game that have moved."""
+    history = get_odds_history()
+    if history is None:
+        return
+    try:
+        ticks = history.movement(game_id)
+    except sqlite3.Error:
+        return
+    ticks = ticks[ticks["bet"].isin(bets)]
+    if bookmaker is not None:
+        ticks = ticks[ticks["bookmaker"] == bookmaker]
+    # Only series with more than one tick have moved
+    counts = ticks.groupby(["bookmaker", "bet", "option"])["odd"].transform("size")
+    ticks = ticks[counts > 1]
+    if ticks.empty:
+        st.caption("📈 No line movement recorded yet.")
+        return
+    st.markdown("**📈 Line movement**")
+    for bet_name, bet_ticks in ticks.groupby("bet", sort=True):
+        st.markdown(f"_{bet_name}_")
+        st.line_chart(line_chart_frame(bet_ticks, until=now_utc))
+
+
+def shows_odds(game: GameModel, now_utc: datetime) -> bool:
+    """Live games and games kicking off within 7 days get an odds panel."""
+    if (game.status or "").upper() == "LIVE":
+        return True
+    return bool(game.parsed_date and game.parsed_date <= now_utc + timedelta(days=7))
+
+
+def paginate(games, key: str, page_size: int = Config.GAMES_PAGE_SIZE):
+    """The slice of `games` on the page picked in this list's page selector."""
+    pages = max(1, -(-len(games) // page_size))
+    if pages == 1:
+        return games
+    col1, col2 = st.columns([1, 3])
+    page = col1.selectbox("Page", range(1, pages + 1), key=f"page_{key}")
+    start = (page - 1) * page_size
+    col2.caption(f"Games {start + 1}–{min(start + page_size, len(games))} of {len(games)}")
+    return games[start:start + page_size]
+
+
+def summary_line(game: GameModel) -> str:
+    status = (game.status or "NS").upper()
+    score = ""
+    if status != "NS" and game.home_score is not None and game.away_score is not None:
+        score = f" {game.home_score} – {game.away_score} "
+    return f"**{game.home_team}**{score or ' vs '}**{game.away_team}** · {status} · 🕒 {format_dt(game)}"
+
+
+def render_game_list(games, now_utc: datetime, league_id: int, season: int, empty_message: str,
+                     key: str, with_odds=True, full_cards=False):
+    """
+    One page of `games` (GAMES_PAGE_SIZE per page). Games show as one-line
+    summaries whose full card (logos, quarters, odds) renders only once
+    opened, unless "Full cards" is on; odds are fetched for the page only.
+    """
+    if not games:
+        st.info(empty_message)
+        return
+    full = st.toggle("Full cards", value=full_cards, key=f"full_{key}")
+    page = paginate(games, key)
+
+    odds = None
+    if with_odds:
+        # Finished games never render odds, so don't spend requests on their dates
+        odds_games = [g for g in page if shows_odds(g, now_utc) and (g.status or "").upper() != "FT"]
+        odds = load_odds_table(odds_games, league_id, season)
+
+    for i, g in enumerate(page):
+        show_odds = with_odds and shows_odds(g, now_utc)
+        if full:
+            display_game(g, now_utc, show_odds=show_odds, odds=odds)
+            continue
+        col1, col2 = st.columns([5, 1])
+        col1.markdown(summary_line(g))
+        if col2.toggle("Details", key=f"open_{key}_{g.game_id if g.game_id is not None else i}"):
+            display_game(g, now_utc, show_odds=show_odds, odds=odds)
+
+
+def render_market_board(games, league_id: int, season: int):
+    """
+    Every market of the live and upcoming slate, ranked by arbitrage edge.
+    Pricing needs the odds of the whole slate, so it is only fetched once
+    the board is switched on.
+    """
+    dates = odds_dates(games)
+    if not dates:
+        st.info("No live or upcoming games to price.")
+        return
+    if not st.toggle("Price the live & upcoming slate", key="board_on"):
+        st.caption(f"Fetches odds for {len(games)} game(s) on {len(dates)} date(s).")
+        return
+    with st.spinner("Pricing markets..."):
+        market_board = fetch_market_board(league_id, season, dates)
+    labels = {g.game_id: f"{g.away_team} @ {g.home_team}" for g in games if g.game_id is not None}
+    board = market_board.board(labels)
+    if board.empty:
+        st.info("Odds not yet released by bookmakers for these games.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Markets", len(board))
+    col2.metric("Arbitrage", int((board["Arb edge %"] > 0).sum()))
+    col3.metric("Avg margin %", f"{board['Avg margin %'].mean():.2f}")
+
+    col1, col2 = st.columns([2, 1])
+    markets = ["All markets"] + sorted(market_board.markets["bet"].astype(str).unique())
+    selected_market = col1.selectbox("Market", markets, key="board_market")
+    arb_only = col2.checkbox("Arbitrage only", key="board_arb")
+    if selected_market != "All markets":
+        board = board[board["Market"].str.startswith(selected_market)]
+    if arb_only:
+        board = board[board["Arb edge %"] > 0]
+    st.dataframe(board, hide_index=True, use_container_width=True)
 
 
 # ----------------- Main -----------------
+DEFAULT_VIEW = "Live & next 7 days"
+
+
 def main():
-    client = APISportsClient()
+    client = get_api_client()
+    start_background_refresher()
+    # Odds panels of this run only (fragment reruns don't pass through main)
+    st.session_state["odds_panels"] = {}
 
     # Sidebar filters
     with st.sidebar:
@@ -352,69 +363,74 @@ def main():
         end_date = st.date_input("End Date")
         custom_search = st.button("Search by Date")
 
-    # Fetch all games (use 'league' param as your client expects)
+    # Season kept parsed in memory; reruns only poll the in-progress window
+    now = datetime.now(timezone.utc)
+    engine = get_live_engine(league_id, selected_season)
     try:
-        api_response = client.get_games(league=league_id, season=selected_season)
+        changed_ids = engine.sync(client, now)
     except TypeError as e:
         st.error(f"Error fetching games: {e}")
         return
     except Exception as e:
         st.error(f"Unexpected error fetching games: {e}")
         return
+    if engine.load_error is not None:
+        kept = " Showing the games from the last successful load." if engine.games else ""
+        st.error(f"Error fetching games: {engine.load_error}.{kept}")
 
-    if not api_response:
+    buckets = engine.status_buckets()
+    if not len(buckets):
         st.info("No games found for the selected league/season.")
         return
 
-    # Parse games robustly
-    games = parse_games(api_response)
-    now = datetime.now(timezone.utc)
+    with st.sidebar:
+        st.markdown("---")
+        st.subheader("Schedule by Week")
+        selected_week = st.selectbox("Week", [DEFAULT_VIEW] + engine.weeks())
 
-    # Buckets
-    live_games = [g for g in games if (g.status or "").upper() == "LIVE"]
-    upcoming_games = [g for g in games if g.parsed_date and g.parsed_date > now and (g.status or "").upper() != "FT"]
-    recent_games = [g for g in games if g.parsed_date and g.parsed_date <= now]
+    live_games = buckets.rows(buckets.mask_status("LIVE"))
 
     # Custom date filter
     if custom_search:
         start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
         end_dt = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-        custom_games = [g for g in games if g.parsed_date and start_dt <= g.parsed_date <= end_dt]
         tabs = st.tabs(["Custom Date Range"])
         with tabs[0]:
-            if custom_games:
-                for g in custom_games:
-                    show_odds = (g.status or "").upper() == "LIVE" or (g.parsed_date and g.parsed_date <= now + timedelta(days=7))
-                    display_game(g, now, show_odds=show_odds, client=client)
-            else:
-                st.info("No games found in this date range.")
+            render_game_list(engine.between(start_dt, end_dt), now, league_id, selected_season,
+                             "No games found in this date range.", key="custom")
         return
 
+    if selected_week != DEFAULT_VIEW:
+        tabs = st.tabs([selected_week])
+        with tabs[0]:
+            render_game_list(engine.week_games(selected_week), now, league_id, selected_season,
+                             "No games found for this week.", key="week")
+        return
+
+    # Time-index windows, in kickoff order
+    upcoming_7 = [g for g in engine.between(now, now + timedelta(days=7), after=True)
+                  if (g.status or "").upper() != "FT"]
+    recent_7 = engine.between(now - timedelta(days=7), now)
+
     # Default tabs
-    tabs = st.tabs(["Live Games", "Upcoming (7 days)", "Recent (7 days)"])
+    tabs = st.tabs(["Live Games", "Upcoming (7 days)", "Recent (7 days)", "Market board"])
 
     with tabs[0]:
-        if live_games:
-            for g in live_games:
-                display_game(g, now, show_odds=True, client=client)
-        else:
-            st.info("No live games currently.")
+        if live_games and changed_ids:
+            st.caption(f"🔄 {len(changed_ids)} game(s) updated since the last refresh")
+        render_game_list(live_games, now, league_id, selected_season, "No live games currently.",
+                         key="live", full_cards=True)
 
     with tabs[1]:
-        upcoming_7 = [g for g in upcoming_games if g.parsed_date and g.parsed_date <= now + timedelta(days=7)]
-        if upcoming_7:
-            for g in upcoming_7:
-                display_game(g, now, show_odds=True, client=client)
-        else:
-            st.info("No upcoming games in the next 7 days.")
+        render_game_list(upcoming_7, now, league_id, selected_season, "No upcoming games in the next 7 days.",
+                         key="upcoming")
 
     with tabs[2]:
-        recent_7 = [g for g in recent_games if g.parsed_date and g.parsed_date >= now - timedelta(days=7)]
-        if recent_7:
-            for g in recent_7:
-                display_game(g, now, show_odds=False, client=client)
-        else:
-            st.info("No recent games in the last 7 days.")
+        render_game_list(recent_7, now, league_id, selected_season, "No recent games in the last 7 days.",
+                         key="recent", with_odds=False)
+
+    with tabs[3]:
+        render_market_board(live_games + upcoming_7, league_id, selected_season)
 
 
 if __name__ == "__main__":
@@ -3,21 +3,44 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
-from api_client import APISportsClient
-from models import Standing, DataProcessor
+from api_client import get_api_client
+from background_refresher import start_background_refresher
+from config import Config
+from models import DataProcessor
+from season_snapshots import get_season_snapshot
 
 # Load from secrets.toml (with safe defaults)
 NFL_LEAGUE_ID = st.secrets.get("NFL_LEAGUE_ID", 1)      # update with correct ID
 NCAA_LEAGUE_ID = st.secrets.get("NCAA_LEAGUE_ID", 2)    # update with correct ID
 APP_TITLE = st.secrets.get("APP_TITLE", "Sports Dashboard")
 
+
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
+def load_standings(league_id, season):
+    """
+    Standings frame and its conference groups, built once per league/season
+    (read from the season snapshot when one exists). Raises LookupError when
+    no rows come back (usually a failed request), so nothing empty is cached
+    and the next rerun asks the API again.
+    """
+    snapshot = get_season_snapshot(league_id, season)
+    if snapshot is not None and snapshot.has("standings"):
+        df = snapshot.standings()
+    else:
+        df = DataProcessor.standings_frame(get_api_client().get_standings(league_id, season))
+    if df.empty:
+        raise LookupError("no standings returned")
+    return df, DataProcessor.conference_groups(df)
+
+
 def main():
     st.title("📊 League Standings")
     st.markdown(
         "View **team rankings**, wins/losses, and performance metrics with clean visuals."
     )
 
-    client = APISportsClient()
+    client = get_api_client()
+    start_background_refresher()
 
     # --- Sidebar filters ---
     with st.sidebar:
@@ -34,19 +57,16 @@ def main():
 
     # --- Fetch standings ---
     with st.spinner("Fetching standings..."):
-        raw_data = client.get_standings(league_id, selected_season)
-
-    # --- Parse safely ---
-    standings = []
-    for entry in raw_data:
-        if not isinstance(entry, dict):
-            continue
         try:
-            standings.append(Standing.from_api_data(entry))
+            standings, groups = load_standings(league_id, selected_season)
+        except LookupError:
+            st.warning("⚠️ Standings data not yet available for this season.")
+            return
         except Exception as e:
-            st.error(f"Error parsing standing: {e}")
+            st.error(f"Error parsing standings: {e}")
+            return
 
-    if not standings or all((s.points or 0) == 0 for s in standings):
+    if standings.empty or (standings["Points"] == 0).all():
         st.warning("⚠️ Standings data not yet available for this season.")
         return
 
@@ -54,97 +74,67 @@ def main():
     st.subheader(f"{selected_league} Standings - {selected_season}")
     st.info("💡 Tip: Click on Teams page for detailed rosters and player statistics.")
 
-    total_teams = len(standings)
-    total_games = sum(s.all_played or 0 for s in standings) // 2
-    total_goals = sum(s.all_goals_for or 0 for s in standings)
-
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Teams", total_teams)
-    col2.metric("Games Played", total_games)
-
-    try:
-        best_team = max(standings, key=lambda s: s.points or 0)
-        col3.metric(
-            "Best Team",
-            f"{best_team.team_name}",
-            f"{best_team.all_win}-{best_team.all_lose}"
-        )
-    except Exception:
-        col3.metric("Best Team", "N/A")
+    col1.metric("Teams", len(standings))
+    col2.metric("Games Played", int(standings["Played"].sum()) // 2)
 
-    col4.metric("Goals Scored", total_goals)
+    best_team = standings.loc[standings["Points"].idxmax()]
+    col3.metric("Best Team", f"{best_team['Team']}", f"{best_team['Wins']}-{best_team['Losses']}")
+
+    col4.metric("Goals Scored", int(standings["GF"].sum()))
     st.markdown("---")
 
     # --- Tabs by Conference ---
     if selected_league == "NFL":
         conference_tabs = ["American Football Conference", "National Football Conference"]
     else:
-        conference_tabs = sorted(set(s.conference for s in standings if s.conference))
+        conference_tabs = list(groups)
 
     tab_objects = st.tabs(conference_tabs)
 
     for i, conf in enumerate(conference_tabs):
         with tab_objects[i]:
-            conf_standings = [s for s in standings if s.conference == conf]
-            if not conf_standings:
+            df = groups.get(conf)
+            if df is None:
                 st.warning(f"No data for {conf} conference.")
                 continue
 
-            df = DataProcessor.standings_to_dataframe(conf_standings)
-
-            # --- Sort by Points descending ---
-            if "Points" in df.columns:
-                df = df.sort_values(by="Points", ascending=False)
-
-            # --- Add Rank column if not exists ---
-            if "Rank" not in df.columns:
-                df.insert(0, "Rank", range(1, len(df) + 1))
-
-            # --- Remove default index completely ---
-            df_display = df.copy()
-            df_display.index = [""] * len(df_display)  # blank index
-
             st.subheader(f"{conf} Conference Standings")
-            st.table(df_display)  # table completely hides index
+            st.table(df[DataProcessor.STANDINGS_COLUMNS])  # blank index
 
             # --- Charts ---
-            if len(conf_standings) > 1:
-                teams = df["Team"].tolist()
-
+            if len(df) > 1:
                 col1, col2 = st.columns(2)
                 with col1:
                     fig = px.bar(
-                        x=teams,
-                        y=df["Points"],
+                        df,
+                        x="Team",
+                        y="Points",
                         title="Total Points by Team",
-                        labels={"x": "Team", "y": "Points"},
                         text_auto=True,
                     )
                     fig.update_xaxes(tickangle=45)
                     st.plotly_chart(fig, use_container_width=True)
 
                 with col2:
-                    win_pct = [
-                        (s.all_win / s.all_played * 100) if s.all_played else 0
-                        for s in conf_standings
-                    ]
                     fig2 = px.bar(
-                        x=teams,
-                        y=win_pct,
+                        df,
+                        x="Team",
+                        y="Win %",
                         title="Win % by Team",
-                        labels={"x": "Team", "y": "Win %"},
                         text_auto=".1f",
                     )
                     fig2.update_xaxes(tickangle=45)
                     st.plotly_chart(fig2, use_container_width=True)
 
                 fig3 = px.scatter(
-                    x=[s.all_goals_for for s in conf_standings],
-                    y=[s.all_goals_against for s in conf_standings],
-                    size=[max(s.points, 0) for s in conf_standings],
-                    text=teams,
+                    df,
+                    x="GF",
+                    y="GA",
+                    size=df["Points"].clip(lower=0),
+                    text="Team",
                     title="Goals For vs Goals Against (Bubble Size = Points)",
-                    labels={"x": "Goals For", "y": "Goals Against"},
+                    labels={"GF": "Goals For", "GA": "Goals Against"},
                 )
                 fig3.update_traces(textposition="top center")
                 st.plotly_chart(fig3, use_container_width=True)
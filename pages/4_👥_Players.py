@@ -1,42 +1,67 @@
+import time
 import streamlit as st
 import pandas as pd
-from api_client import APISportsClient
+from api_client import get_api_client
+from background_refresher import start_background_refresher
 from config import Config
+from player_search import PlayerSearchIndex
+from season_snapshots import get_season_snapshot
 
 # ----- Caching -----
-@st.cache_resource
-def get_api_client():
-    return APISportsClient()
-
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
 def fetch_teams(_api_client, league, season):
     # try:
+        snapshot = get_season_snapshot(league, season)
+        if snapshot is not None and snapshot.has("teams"):
+            return snapshot.teams()
         teams_data = _api_client.get_teams(league=league, season=season)
         return {t["id"]: t["name"] for t in teams_data}
     # except Exception as e:
     #     st.error(f"Error fetching teams: {e}")
     #     return {}
 
-@st.cache_data(show_spinner=False)
-def fetch_players(_api_client, teams_dict, season, selected_team_id=None, search_name=None):
+@st.cache_resource
+def _roster_store():
+    """Completed rosters, {(league, season, team_id): (loaded_at, players)}, shared across sessions."""
+    return {}
+
+def _stored_rosters(league_id, season):
+    """This league/season's rosters loaded within CACHE_DURATION; older entries are dropped."""
+    store = _roster_store()
+    cutoff = time.monotonic() - Config.CACHE_DURATION
+    rosters = {}
+    for key, (loaded_at, players) in list(store.items()):
+        if loaded_at < cutoff:
+            store.pop(key, None)
+        elif key[:2] == (league_id, season):
+            rosters[key[2]] = players
+    return rosters
+
+@st.cache_resource
+def _search_index(league_id, season):
+    """Name search index over the rosters loaded for a league/season, shared across sessions."""
+    return PlayerSearchIndex()
+
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
+def fetch_players(_api_client, teams_dict, league, season, selected_team_id=None):
     players = []
     try:
         # Filter by team
         team_ids = [selected_team_id] if selected_team_id else [list(teams_dict.keys())[0]]
+        snapshot = get_season_snapshot(league, season)
         for team_id in team_ids:
-            team_players = _api_client.get_players(team=team_id, season=season)
-            for p in team_players:
-                p["team_name"] = teams_dict.get(team_id, "")
-            players.extend(team_players)
-        # Filter by name
-        if search_name:
-            players = [p for p in players if search_name.lower() in p["name"].lower()]
+            if snapshot is not None and snapshot.has("players"):
+                players.extend(snapshot.roster(team_id, teams_dict.get(team_id, "")))
+                continue
+            # Copies: the response envelope may be shared with other requests
+            players.extend({**p, "team_name": teams_dict.get(team_id, "")}
+                           for p in _api_client.get_players(team=team_id, season=season))
         return players
     except Exception as e:
         st.error(f"Error fetching players: {e}")
         return []
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=Config.CACHE_DURATION)
 def fetch_player_stats(_api_client, player_id, season):
     try:
         stats = _api_client.get_player_statistics(player_id, season)
@@ -99,7 +124,7 @@ def render_profile(player, season):
 
 
 # ----- Player Directory -----
-def render_directory(players, teams_dict, season):
+def render_directory(players, teams_dict, league_id, season):
     st.subheader("📂 Player Directory")
 
     # Team dropdown (full list)
@@ -113,14 +138,82 @@ def render_directory(players, teams_dict, season):
     # Name search
     search_name = st.text_input("🔍 Search by player name")
 
-    # Fetch filtered players
-    filtered_players = fetch_players(get_api_client(), teams_dict, season, selected_team_id, search_name)
+    index = _search_index(league_id, season)
+    if selected_team_id is None:
+        render_all_teams(teams_dict, league_id, season, search_name, index)
+        return
+
+    # Fetch the team's roster (cached per team, not per keystroke), then search it
+    filtered_players = fetch_players(get_api_client(), teams_dict, league_id, season, selected_team_id)
+    if search_name:
+        index.add_roster(selected_team_id, filtered_players)
+        filtered_players = index.search(search_name, team_id=selected_team_id)
+    render_player_cards(filtered_players)
+
+
+def render_all_teams(teams_dict, league_id, season, search_name, index):
+    """
+    Stream every team's roster into the directory. Rosters already in the
+    shared store (kept for CACHE_DURATION) render immediately; the rest are
+    fetched concurrently and appended as each team completes, until the
+    fan-out deadline. Every
+    roster goes into the search index; with a name search, the ranked
+    matches are rendered once the rosters are in. A finished season with a
+    snapshot fills the store from it without any request.
+    """
+    store = _roster_store()
+    rosters = _stored_rosters(league_id, season)
+    snapshot = get_season_snapshot(league_id, season)
+    if snapshot is not None and snapshot.has("players"):
+        for team_id in teams_dict:
+            if team_id not in rosters:
+                rosters[team_id] = snapshot.roster(team_id, teams_dict.get(team_id, ""))
+                store[(league_id, season, team_id)] = (time.monotonic(), rosters[team_id])
+    missing = [t for t in teams_dict if t not in rosters]
+    progress = st.progress(0.0, text="Loading rosters...") if missing else None
+    grid = st.container()
+
+    def emit(team_id, players):
+        index.add_roster(team_id, players)
+        if not search_name:
+            with grid:
+                render_player_cards(players)
+
+    for team_id in teams_dict:
+        if team_id in rosters:
+            emit(team_id, rosters[team_id])
+
+    if missing and get_api_client().quota_low():
+        progress.empty()
+        st.warning(f"API quota is low; skipped loading {len(missing)} more team rosters.")
+    elif missing:
+        done = loaded = 0
+        for team_id, team_players in get_api_client().iter_team_rosters(missing, season):
+            done += 1
+            progress.progress(done / len(missing), text=f"Loaded {done}/{len(missing)} rosters")
+            if team_players is None:
+                continue
+            loaded += 1
+            # Copies: the response envelope is shared through the cache
+            team_players = [{**p, "team_name": teams_dict.get(team_id, "")} for p in team_players]
+            store[(league_id, season, team_id)] = (time.monotonic(), team_players)
+            emit(team_id, team_players)
+        progress.empty()
+
+        if loaded < len(missing):
+            st.warning(f"{len(missing) - loaded} team rosters failed or timed out; showing partial results.")
+
+    if search_name:
+        with grid:
+            render_player_cards(index.search(search_name))
+
 
+def render_player_cards(players):
     # Display player cards in rows
     row_size = 4
-    for i in range(0, len(filtered_players), row_size):
+    for i in range(0, len(players), row_size):
         cols = st.columns(row_size)
-        for j, player in enumerate(filtered_players[i:i+row_size]):
+        for j, player in enumerate(players[i:i+row_size]):
             with cols[j]:
                 img_url = player.get("image") or "https://via.placeholder.com/100?text=No+Image"
                 st.image(img_url, width=100)
@@ -136,6 +229,7 @@ def main():
     st.markdown("Explore real player profiles, stats, and insights.")
 
     api_client = get_api_client()
+    start_background_refresher()
 
     st.sidebar.header("Filters")
     league_options = {"NFL": Config.NFL_LEAGUE_ID, "NCAA": Config.NCAA_LEAGUE_ID}
@@ -159,11 +253,13 @@ def main():
     if "selected_player" in st.session_state:
         render_profile(st.session_state["selected_player"], selected_season)
     else:
-        players = fetch_players(api_client, teams_dict, selected_season)
+        # Same arguments as the directory's default team view, so its roster is fetched once
+        first_team_id = next(iter(teams_dict), None)
+        players = fetch_players(api_client, teams_dict, league_id, selected_season, first_team_id)
         if not players:
             st.info(f"No players available for season {selected_season}.")
         else:
-            render_directory(players, teams_dict, selected_season)
+            render_directory(players, teams_dict, league_id, selected_season)
 
 
 if __name__ == "__main__":
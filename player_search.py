@@ -0,0 +1,129 @@
+import difflib
+import re
+import threading
+import unicodedata
+
+NGRAM = 3
+FUZZY_CUTOFF = 0.75
+
+_DROP = re.compile(r"[.'’`]")
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name) -> str:
+    """Lower-case, accent-free, punctuation-free name: "A.J. Brown" -> "aj brown"."""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(_SEPARATORS.sub(" ", _DROP.sub("", text)).split())
+
+
+def _ngrams(text):
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class PlayerSearchIndex:
+    """
+    Name search over every roster loaded for one league/season.
+
+    Rosters are added per team (a changed roster replaces the team's rows);
+    each player's normalized name is indexed by its character trigrams, so
+    a query only substring-checks the players sharing its rarest trigram.
+    Hits are ranked full-name prefix, then word prefix, then substring; when
+    nothing matches, the query is fuzzy-matched (difflib) against full names
+    and single words. Shared across sessions, so mutation is guarded by a
+    lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rosters = {}   # team_id -> players as last indexed
+        self._reset()
+
+    def _reset(self):
+        self._players = []   # None for a replaced row
+        self._names = []
+        self._teams = []
+        self._grams = {}     # trigram -> row ids, ascending
+        self._words = {}     # name or single word -> row ids
+        self._team_rows = {}
+        self._dead = 0
+
+    def __len__(self):
+        return len(self._players) - self._dead
+
+    def has_team(self, team_id) -> bool:
+        return team_id in self._rosters
+
+    def add_roster(self, team_id, players):
+        """
+        Index one team's players. Re-adding an unchanged roster is a no-op; a
+        changed one (e.g. re-fetched after its cache expired) replaces the
+        team's rows.
+        """
+        players = list(players)
+        with self._lock:
+            if team_id in self._rosters:
+                if self._rosters[team_id] == players:
+                    return
+                for row in self._team_rows.pop(team_id, ()):
+                    self._players[row] = self._teams[row] = None
+                    self._names[row] = ""
+                    self._dead += 1
+            self._rosters[team_id] = players
+            if self._dead > len(self._players) // 2:
+                # Mostly replaced rows: rebuild from the current rosters
+                self._reset()
+                for team, roster in self._rosters.items():
+                    self._index(team, roster)
+            else:
+                self._index(team_id, players)
+
+    def _index(self, team_id, players):
+        rows = self._team_rows.setdefault(team_id, [])
+        for player in players:
+            row = len(self._players)
+            name = normalize_name(player.get("name"))
+            self._players.append(player)
+            self._names.append(name)
+            self._teams.append(team_id)
+            rows.append(row)
+            for gram in _ngrams(name):
+                self._grams.setdefault(gram, []).append(row)
+            for word in {name, *name.split()}:
+                self._words.setdefault(word, []).append(row)
+
+    def search(self, query, team_id=None, limit=None):
+        """Players whose name matches `query` (optionally on one team), best first."""
+        q = normalize_name(query)
+        with self._lock:
+            if not q:
+                rows = range(len(self._players))
+            else:
+                rows = self._substring_rows(q) or self._fuzzy_rows(q)
+            if team_id is not None:
+                rows = [r for r in rows if self._teams[r] == team_id]
+            rows = [r for r in rows if self._players[r] is not None][:limit]
+            return [self._players[r] for r in rows]
+
+    def _substring_rows(self, q):
+        grams = _ngrams(q)
+        if grams:
+            postings = [self._grams.get(g, ()) for g in grams]
+            candidates = min(postings, key=len)
+        else:
+            candidates = range(len(self._names))
+        names = self._names
+        hits = [r for r in candidates if q in names[r]]
+        spaced = " " + q
+
+        def rank(r):
+            name = names[r]
+            return 0 if name.startswith(q) else 1 if spaced in " " + name else 2
+
+        return sorted(hits, key=rank)   # stable: ties keep roster order
+
+    def _fuzzy_rows(self, q):
+        rows = []
+        for word in difflib.get_close_matches(q, self._words.keys(), n=10, cutoff=FUZZY_CUTOFF):
+            rows.extend(r for r in self._words[word] if r not in rows)
+        return rows
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import requests
+
+# Request priorities (lower value is served first)
+PRIORITY_INTERACTIVE = 0   # user is waiting on this (odds expander, profile)
+PRIORITY_DEFAULT = 1       # normal page loads
+PRIORITY_BACKGROUND = 2    # bulk / prefetch work (roster fan-out, refreshers)
+
+
+class RateLimitExceeded(requests.RequestException):
+    """Raised when a request cannot be scheduled within the API quota."""
+
+
+class RateLimiter:
+    """
+    Token bucket paced by API-Sports quota headers.
+
+    Starts from configured per-minute/per-day limits and re-synchronises with
+    the server after every response (X-RateLimit-* for the minute window,
+    x-ratelimit-requests-* for the daily quota). Higher-priority waiters are
+    always served first, and non-interactive callers leave `reserve` tokens
+    untouched so a user click never queues behind a bulk prefetch.
+    """
+
+    def __init__(self, per_minute: int, per_day: int = None, reserve: int = 1):
+        self._cond = threading.Condition()
+        self._waiting = [0, 0, 0]
+        self.reserve = reserve
+        self.minute_limit = per_minute
+        self.tokens = float(per_minute)
+        self.day_limit = per_day
+        self.day_remaining = per_day
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        rate = self.minute_limit / 60.0
+        self.tokens = min(float(self.minute_limit), self.tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def acquire(self, priority: int = PRIORITY_DEFAULT, timeout: float = None) -> bool:
+        """Block until a token is available for `priority`; False on timeout or exhausted daily quota."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    floor = 0 if priority == PRIORITY_INTERACTIVE else self.reserve
+                    if self.day_remaining is not None and self.day_remaining <= floor:
+                        return False
+                    ahead = any(self._waiting[p] for p in range(priority))
+                    if not ahead and self.tokens - floor >= 1:
+                        self.tokens -= 1
+                        if self.day_remaining is not None:
+                            self.day_remaining -= 1
+                        return True
+                    wait = max(1 - (self.tokens - floor), 0.05) * 60.0 / self.minute_limit
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def update_from_headers(self, headers, status_code: int = 200):
+        """Align the bucket with the quota the server reports."""
+        minute_limit = _int_header(headers, "X-RateLimit-Limit")
+        minute_remaining = _int_header(headers, "X-RateLimit-Remaining")
+        day_limit = _int_header(headers, "x-ratelimit-requests-limit")
+        day_remaining = _int_header(headers, "x-ratelimit-requests-remaining")
+        with self._cond:
+            self._refill()
+            if minute_limit:
+                self.minute_limit = minute_limit
+            if minute_remaining is not None:
+                self.tokens = min(self.tokens, float(minute_remaining))
+            if day_limit is not None:
+                self.day_limit = day_limit
+            if day_remaining is not None:
+                self.day_remaining = day_remaining
+            if status_code == 429:
+                self.tokens = 0.0
+            self._cond.notify_all()
+
+    def budget(self) -> dict:
+        """Snapshot of the remaining quota."""
+        with self._cond:
+            self._refill()
+            return {
+                "minute_remaining": int(self.tokens),
+                "minute_limit": self.minute_limit,
+                "day_remaining": self.day_remaining,
+                "day_limit": self.day_limit,
+            }
+
+
+def _int_header(headers, name):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,160 @@
+import codecs
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlencode
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    endpoint    TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    stored_at   REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class ResponseCache:
+    """
+    Persistent cache of API response envelopes, stored in SQLite.
+
+    Entries are keyed on endpoint + normalized params, stored as
+    zlib-compressed JSON, and expire per endpoint TTL. Expired rows are kept
+    (they can still be served as stale data) until the file grows past
+    `max_bytes`, at which point the least recently used rows are evicted.
+    WAL mode and a busy timeout make the file safe to share between several
+    worker processes; each thread uses its own connection.
+    """
+
+    def __init__(self, path: str, max_bytes: int, ttls: dict, default_ttl: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict = None) -> str:
+        endpoint = endpoint.strip("/")
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return f"{endpoint}?{urlencode(items)}" if items else endpoint
+
+    def ttl_for(self, endpoint: str) -> int:
+        return self.ttls.get(endpoint.strip("/"), self.default_ttl)
+
+    def get(self, endpoint: str, params: dict = None, max_stale: float = 0):
+        """
+        Return (payload, is_fresh) or None on a miss. Entries that expired at
+        most `max_stale` seconds ago are returned with is_fresh=False
+        (max_stale=None accepts any age).
+        """
+        hit = self.get_blob(endpoint, params, max_stale)
+        if hit is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(hit[0])), hit[1]
+        except (zlib.error, ValueError):
+            return None
+
+    def get_blob(self, endpoint: str, params: dict = None, max_stale: float = 0):
+        """Like `get`, but the payload stays compressed JSON (see inflate_text)."""
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            is_fresh = row[1] > now
+            if not is_fresh and max_stale is not None and now - row[1] > max_stale:
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0]), is_fresh
+        except sqlite3.Error:
+            return None
+
+    def set(self, endpoint: str, params: dict, payload, ttl: int = None):
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+        self.set_blob(endpoint, params, blob, ttl)
+
+    def set_blob(self, endpoint: str, params: dict, blob: bytes, ttl: int = None):
+        """Store an already zlib-compressed UTF-8 JSON payload."""
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.ttl_for(endpoint))
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, endpoint, payload, size, stored_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, endpoint.strip("/"), blob, len(blob), now, expires_at, now),
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            # The cache is an optimisation; a locked or corrupt file must not break a page.
+            pass
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC) AS running FROM responses"
+            " ) WHERE running > ?"
+            ")",
+            (self.max_bytes,),
+        )
+
+    def stats(self) -> dict:
+        row = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(expires_at > ?), 0) FROM responses",
+            (time.time(),),
+        ).fetchone()
+        return {"entries": row[0], "bytes": row[1], "fresh": row[2]}
+
+
+def inflate_text(blob: bytes, chunk_size: int = 64 * 1024):
+    """Decompress a stored payload as text chunks of at most `chunk_size` bytes (for json_stream)."""
+    inflater = zlib.decompressobj()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(blob), chunk_size):
+        data = blob[start:start + chunk_size]
+        while data:
+            text = decoder.decode(inflater.decompress(data, chunk_size))
+            data = inflater.unconsumed_tail
+            if text:
+                yield text
+    text = decoder.decode(inflater.flush(), final=True)
+    if text:
+        yield text
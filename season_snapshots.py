@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Columnar snapshots of finished seasons.
+
+A season's games, standings, teams and rosters are written once as
+uncompressed Arrow IPC (Feather v2) files under
+Config.SNAPSHOT_DIR/<league>/<season>/<kind>.arrow. Pages open them with a
+memory map, so the Arrow columns live in the page cache rather than the
+heap and a past-season view costs no API quota. Turning them into Game
+objects, DataFrames or dicts still copies the values, once per read. A
+season still running (playoffs included) is never snapshotted; it always
+comes from the API.
+
+Usage:
+    python season_snapshots.py                      # both leagues, the two past seasons
+    python season_snapshots.py --leagues 1 --seasons 2023,2024 --dir .cache/snapshots
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import streamlit as st
+from streamlit.logger import set_log_level
+
+from api_client import get_api_client
+from config import Config
+from game_parser import parse_games
+from models import DataProcessor, Game
+
+_GAME_SCHEMA = pa.schema([
+    ("game_id", pa.int64()),
+    ("week", pa.string()),
+    ("home_team", pa.string()),
+    ("away_team", pa.string()),
+    ("home_score", pa.int64()),
+    ("away_score", pa.int64()),
+    ("venue", pa.string()),
+    ("status", pa.string()),
+    ("kickoff", pa.timestamp("s", tz="UTC")),
+    ("home_logo", pa.string()),
+    ("away_logo", pa.string()),
+    ("scores", pa.string()),   # quarter breakdown, as JSON
+])
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def games_table(games) -> pa.Table:
+    """Parsed Game objects -> one Arrow table (one column per field)."""
+    return pa.table({
+        "game_id": [_int_or_none(g.game_id) for g in games],
+        "week": [g.week for g in games],
+        "home_team": [g.home_team for g in games],
+        "away_team": [g.away_team for g in games],
+        "home_score": [_int_or_none(g.home_score) for g in games],
+        "away_score": [_int_or_none(g.away_score) for g in games],
+        "venue": [g.venue for g in games],
+        "status": [g.status for g in games],
+        "kickoff": [g.parsed_date for g in games],
+        "home_logo": [g.home_logo for g in games],
+        "away_logo": [g.away_logo for g in games],
+        "scores": [json.dumps(g.scores or {}, separators=(",", ":")) for g in games],
+    }, schema=_GAME_SCHEMA)
+
+
+def games_from_table(table: pa.Table):
+    """Inverse of games_table: Game objects with kickoffs already parsed (copies every value)."""
+    columns = {name: table.column(name).to_pylist() for name in table.column_names}
+    return [
+        Game(
+            home_team=columns["home_team"][i],
+            away_team=columns["away_team"][i],
+            home_score=columns["home_score"][i],
+            away_score=columns["away_score"][i],
+            venue=columns["venue"][i],
+            date=kickoff.strftime("%Y-%m-%dT%H:%M:%SZ") if kickoff else "",
+            status=columns["status"][i],
+            scores=json.loads(columns["scores"][i]),
+            home_logo=columns["home_logo"][i],
+            away_logo=columns["away_logo"][i],
+            game_id=columns["game_id"][i],
+            week=columns["week"][i],
+            parsed_date=kickoff,
+        )
+        for i, kickoff in enumerate(columns["kickoff"])
+    ]
+
+
+def rows_table(rows) -> pa.Table:
+    """
+    API dicts -> Arrow table over the union of their keys. A column whose
+    values don't share one type (e.g. 12 and "12") is stored as strings.
+    """
+    keys = list(dict.fromkeys(k for row in rows for k in row))
+    columns = {}
+    for key in keys:
+        values = [row.get(key) for row in rows]
+        try:
+            columns[key] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns[key] = pa.array([None if v is None else str(v) for v in values], pa.string())
+    return pa.table(columns)
+
+
+def write_table(path: str, table: pa.Table):
+    """Write an uncompressed IPC file atomically (readers never see a partial file)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def read_table(path: str) -> pa.Table:
+    """Memory-map an IPC file; the table's buffers point into the mapping (no copy)."""
+    return ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+class SeasonSnapshot:
+    """The snapshot files of one league/season; each kind is mapped on first use."""
+
+    def __init__(self, root: str, league: int, season: int):
+        self.directory = os.path.join(root, str(league), str(season))
+        self._tables = {}
+
+    def path(self, kind: str) -> str:
+        return os.path.join(self.directory, f"{kind}.arrow")
+
+    def has(self, kind: str) -> bool:
+        return os.path.exists(self.path(kind))
+
+    def table(self, kind: str) -> pa.Table:
+        if kind not in self._tables:
+            self._tables[kind] = read_table(self.path(kind))
+        return self._tables[kind]
+
+    def games(self):
+        return games_from_table(self.table("games"))
+
+    def standings(self):
+        """The DataProcessor.standings_frame of the season, as a new DataFrame."""
+        return self.table("standings").to_pandas()
+
+    def teams(self) -> dict:
+        table = self.table("teams")
+        return dict(zip(table.column("id").to_pylist(), table.column("name").to_pylist()))
+
+    def roster(self, team_id, team_name: str = "") -> list:
+        """One team's players as API-shaped dicts, tagged with team_name like a live fetch."""
+        table = self.table("players")
+        rows = table.filter(pc.equal(table.column("team_id"), team_id)).to_pylist()
+        for row in rows:
+            row["team_name"] = team_name
+        return rows
+
+
+@st.cache_resource(max_entries=Config.SNAPSHOT_MAX_OPEN)
+def _open_snapshot(root: str, league: int, season: int) -> SeasonSnapshot:
+    """One SeasonSnapshot per directory, shared by every session."""
+    return SeasonSnapshot(root, league, season)
+
+
+def get_season_snapshot(league: int, season: int):
+    """
+    The snapshot of a finished league/season, or None (still running, or not
+    exported). Only existing snapshots reach the cache, so a season exported
+    while the app runs is picked up on the next lookup.
+    """
+    if not get_api_client().is_season_finished(season):
+        return None
+    if not os.path.isdir(os.path.join(Config.SNAPSHOT_DIR, str(league), str(season))):
+        return None
+    return _open_snapshot(Config.SNAPSHOT_DIR, league, season)
+
+
+# ----- Exporter -----
+def export_season(client, league: int, season: int, root: str) -> dict:
+    """
+    Fetch one season from the API and write its snapshot files; returns row
+    counts. A kind that comes back empty (usually a failed request) is not
+    written, so pages keep using the API for it.
+    """
+    snapshot = SeasonSnapshot(root, league, season)
+    counts = {}
+
+    games = parse_games(client.get_games(league=league, season=season))
+    if games:
+        write_table(snapshot.path("games"), games_table(games))
+    counts["games"] = len(games)
+
+    standings = DataProcessor.standings_frame(client.get_standings(league, season))
+    if len(standings):
+        write_table(snapshot.path("standings"), pa.Table.from_pandas(standings, preserve_index=False))
+    counts["standings"] = len(standings)
+
+    teams = [t for t in client.get_teams(league=league, season=season) if isinstance(t, dict)]
+    if teams:
+        write_table(snapshot.path("teams"), rows_table(teams))
+    counts["teams"] = len(teams)
+
+    players, failed = [], 0
+    for team_id, roster in client.iter_team_rosters([t["id"] for t in teams], season):
+        if roster is None:
+            failed += 1
+            continue
+        players.extend({**p, "team_id": team_id} for p in roster if isinstance(p, dict))
+    if players:
+        write_table(snapshot.path("players"), rows_table(players))
+    counts["players"] = len(players)
+    counts["rosters_failed"] = failed
+    return counts
+
+
+def main():
+    # st calls outside `streamlit run` log a missing-ScriptRunContext warning each.
+    st.config.get_config_options()
+    set_log_level("error")
+
+    client = get_api_client()
+    current = client.get_current_season()
+    parser = argparse.ArgumentParser(description="Export finished seasons as Arrow snapshots")
+    parser.add_argument("--leagues", default=f"{Config.NFL_LEAGUE_ID},{Config.NCAA_LEAGUE_ID}")
+    parser.add_argument("--seasons", default=f"{current - 2},{current - 1}",
+                        help="comma-separated; seasons still running (playoffs included) are skipped")
+    parser.add_argument("--dir", default=Config.SNAPSHOT_DIR)
+    args = parser.parse_args()
+
+    for league in (int(x) for x in args.leagues.split(",")):
+        for season in (int(x) for x in args.seasons.split(",")):
+            if not client.is_season_finished(season):
+                print(f"league {league} season {season}: skipped (season not finished)")
+                continue
+            counts = export_season(client, league, season, args.dir)
+            print(f"league {league} season {season}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+            if counts["rosters_failed"]:
+                print(f"  ⚠️ {counts['rosters_failed']} rosters failed; re-run to complete players.arrow",
+                      file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
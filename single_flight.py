@@ -0,0 +1,71 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait and receive the same result (or exception). The shared
+    result object is handed to every waiter, so treat it as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        call, leader = self.join(key)
+        if not leader:
+            return self.wait(call)
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result=result)
+        return result
+
+    def join(self, key):
+        """
+        Low-level form of `do` for work that can't be wrapped in one call
+        (e.g. a generator). Returns (call, leader): the leader must call
+        `finish` exactly once; everyone else passes the call to `wait`.
+        """
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        return call, leader
+
+    def finish(self, key, call, result=None, error=None):
+        call.result, call.error = result, error
+        with self._lock:
+            del self._inflight[key]
+        call.done.set()
+
+    @staticmethod
+    def wait(call):
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._inflight)}
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the API-Sports american-football API.
+
+Serves the dummy_data generators over the real URL shapes (/games,
+/standings, /odds, /players/statistics, ...) wrapped in the API-Sports
+response envelope, so the real APISportsClient HTTP path can be exercised
+and benchmarked without spending quota.
+
+Responses are seeded: the same seed, anchor time, path and query string
+always produce the same payload. dummy_data's "now" is pinned to the anchor
+(default: server start, truncated to the hour).
+Latency, jitter, error rate and rate-limit headers are configurable.
+
+Usage:
+    python stub_server.py --port 8800 --seed 42 --latency 80 --jitter 40
+    API_SPORTS_BASE_URL=http://127.0.0.1:8800/ API_SPORTS_KEY=stub streamlit run main.py
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import dummy_data
+from dummy_data import CONFERENCE_NAMES, DUMMY_DATA, generate_dummy_players
+
+# Markets listed by /odds/bets (matches the bets emitted by generate_dummy_odds).
+DUMMY_BETS = [{"id": 1, "name": "Match Winner"}, {"id": 2, "name": "Over/Under"}]
+
+
+def _frozen_datetime(anchor: datetime):
+    """datetime subclass whose now() always returns `anchor`."""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return anchor if tz is None else anchor.astimezone(tz)
+    return FrozenDatetime
+
+
+def _coerce(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _api_standing(raw, league_id, season):
+    """Reshape a dummy_data standing into the flat /standings layout."""
+    totals = raw["all"]
+    conference = raw["group"]["name"]
+    return {
+        "league": {"id": league_id, "season": season},
+        "conference": CONFERENCE_NAMES.get(conference, conference),
+        "division": raw["team"].get("division"),
+        "position": raw["rank"],
+        "team": {k: raw["team"][k] for k in ("id", "name", "logo")},
+        "won": totals["win"],
+        "lost": totals["lose"],
+        "ties": totals["draw"],
+        "points": {
+            "for": totals["goals"]["for"],
+            "against": totals["goals"]["against"],
+            "difference": raw["goalsDiff"],
+        },
+        "streak": raw["form"],
+    }
+
+
+def generate(endpoint: str, params: dict):
+    """Dispatch an endpoint + params to its dummy_data generator (None if unknown)."""
+    league_id = params.get("league", 1)
+    season = params.get("season", 2024)
+    date = params.get("date")
+    team_id = params.get("team")
+    game_id = params.get("game") or params.get("fixture") or params.get("id")
+
+    if endpoint == "players/statistics":
+        return generate_dummy_players(league_id, season, team_id, params.get("id"))
+    if endpoint == "odds/bets":
+        return DUMMY_BETS
+    generator = DUMMY_DATA.get(endpoint)
+    if generator is None:
+        return None
+    if endpoint == "games":
+        return generator(league_id, season, date, team_id, params.get("week"))
+    if endpoint == "standings":
+        return [_api_standing(s, league_id, season) for s in generator(league_id, season)]
+    if endpoint == "teams":
+        # The real /teams response is a flat list of team objects.
+        return [{**t["team"], "conference": t["conference"], "division": t["division"]}
+                for t in generator(league_id, season)]
+    if endpoint == "players":
+        # The real /players response is a flat list of player objects.
+        return [{**p["player"], "image": p["player"].get("photo")}
+                for p in generator(league_id, season, team_id, params.get("id"))]
+    if endpoint == "odds":
+        return generator(league_id, season, date, game_id)
+    if endpoint == "leagues":
+        return generator(params.get("country", "US"))
+    if endpoint in ("injuries", "teams/statistics"):
+        return generator(league_id, season, team_id)
+    if endpoint in ("games/events", "games/players"):
+        return generator(game_id or 1000)
+    return generator()
+
+
+class StubAPIServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stub's settings and request counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address, seed=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 rate_limit_per_minute=None, rate_limit_per_day=None, anchor: datetime = None):
+        super().__init__(address, _Handler)
+        self.seed = seed
+        self.anchor = anchor or datetime.now().replace(minute=0, second=0, microsecond=0)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.rate_limit_per_day = rate_limit_per_day
+        self.counts = Counter()
+        self._minute_window = deque()
+        self._day_count = 0
+        self._lock = threading.Lock()
+        # dummy_data draws from the global `random` module, so generation is serialised.
+        self._generate_lock = threading.Lock()
+        self._noise = random.Random(seed)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        """Serve from a background thread (for in-process benchmarks and load tests)."""
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def payload(self, endpoint: str, query: str, params: dict):
+        with self._generate_lock:
+            random.seed(zlib.crc32(f"{self.seed}|{endpoint}|{query}".encode()))
+            real_datetime = dummy_data.datetime
+            dummy_data.datetime = _frozen_datetime(self.anchor)
+            try:
+                return generate(endpoint, params)
+            finally:
+                dummy_data.datetime = real_datetime
+
+    def record(self, endpoint: str):
+        with self._lock:
+            self.counts[endpoint] += 1
+
+    def admit(self):
+        """
+        Count the request against the simulated quota.
+        Returns (allowed, rate-limit headers).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.counts["_total"] += 1
+            window = self._minute_window
+            while window and now - window[0] > 60:
+                window.popleft()
+            headers = {}
+            allowed = True
+            if self.rate_limit_per_minute:
+                allowed = len(window) < self.rate_limit_per_minute
+                headers["X-RateLimit-Limit"] = str(self.rate_limit_per_minute)
+                headers["X-RateLimit-Remaining"] = str(max(self.rate_limit_per_minute - len(window) - allowed, 0))
+            if self.rate_limit_per_day:
+                allowed = allowed and self._day_count < self.rate_limit_per_day
+                headers["x-ratelimit-requests-limit"] = str(self.rate_limit_per_day)
+                headers["x-ratelimit-requests-remaining"] = str(max(self.rate_limit_per_day - self._day_count - allowed, 0))
+            if allowed:
+                window.append(now)
+                self._day_count += 1
+            return allowed, headers
+
+    def sample_fault(self):
+        """Returns (delay in seconds, inject a failure?) for one request."""
+        with self._lock:
+            jitter = self._noise.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+            fail = self._noise.random() < self.error_rate
+        return max(self.latency_ms + jitter, 0.0) / 1000.0, fail
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real API
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        endpoint = parts.path.strip("/")
+        params = {k: _coerce(v) for k, v in parse_qsl(parts.query)}
+
+        allowed, headers = server.admit()
+        delay, fail = server.sample_fault()
+        if delay:
+            time.sleep(delay)
+
+        server.record(endpoint)
+
+        if not allowed:
+            return self._send(429, headers, endpoint, params, [],
+                              errors={"rateLimit": "Too many requests. You have exceeded the limit of requests."})
+        if fail:
+            return self._send(503, headers, endpoint, params, [], errors={"server": "Injected failure"})
+
+        data = server.payload(endpoint, parts.query, params)
+        if data is None:
+            return self._send(404, headers, endpoint, params, [], errors={"endpoint": "This endpoint does not exist."})
+        self._send(200, headers, endpoint, params, data)
+
+    def _send(self, status, headers, endpoint, params, data, errors=None):
+        envelope = {
+            "get": endpoint,
+            "parameters": {k: str(v) for k, v in params.items()},
+            "errors": errors or [],
+            "results": len(data) if isinstance(data, list) else 1,
+            "response": data,
+        }
+        body = json.dumps(envelope).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in API-Sports server backed by dummy_data")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--rate-limit-per-minute", type=int, default=None)
+    parser.add_argument("--rate-limit-per-day", type=int, default=None)
+    parser.add_argument("--anchor", type=datetime.fromisoformat, default=None,
+                        help="ISO timestamp used as 'now' for generated dates (default: this hour)")
+    args = parser.parse_args()
+
+    server = StubAPIServer(
+        (args.host, args.port),
+        seed=args.seed,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_per_minute=args.rate_limit_per_minute,
+        rate_limit_per_day=args.rate_limit_per_day,
+        anchor=args.anchor,
+    )
+    print(f"🏈 Stub API-Sports server on {server.base_url} (seed={args.seed})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Seeded, production-size synthetic data in the API-Sports american-football
+shapes, for benchmarks and load tests.
+
+dummy_data.py is fine for eyeballing the UI but draws a handful of rows from
+the unseeded global `random` module. SyntheticDataset generates whole
+seasons with NumPy batch draws instead: every (seed, league, season, kind)
+has its own generator, so the same arguments always give the same data and
+one season can be generated without the others.
+
+Arrays (`game_arrays`, `odds_arrays`) are the primary form; `games`, `odds`,
+`standings`, `teams` and `players` build the API `response` lists from them.
+
+Usage:
+    python synthetic_data.py --league 2 --seasons 3 --out .cache/synthetic
+    python synthetic_data.py --teams 512 --games-per-week 256 --bookmakers 12 --out /tmp/big
+"""
+
+import argparse
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+
+import numpy as np
+
+from dummy_data import CONFERENCE_NAMES, NCAA_TEAMS, NFL_TEAMS, VENUES
+
+BOOKMAKERS = [
+    "DraftKings", "FanDuel", "BetMGM", "Caesars", "PointsBet", "Bet365", "Unibet", "William Hill",
+    "Bovada", "BetRivers", "Pinnacle", "Betway", "888sport", "Betfair", "Bwin", "Marathonbet",
+]
+
+# (id, name) as listed by /odds/bets.
+BETS = [(1, "Home/Away"), (2, "Asian Handicap"), (3, "Over/Under")]
+
+CITIES = [
+    "Austin", "Portland", "Omaha", "Boise", "Tulsa", "Fresno", "Reno", "Albany", "Spokane", "Tucson",
+    "Raleigh", "Richmond", "Madison", "Lexington", "Wichita", "Toledo", "Akron", "Dayton", "Provo", "Eugene",
+]
+MASCOTS = [
+    "Hawks", "Bears", "Rams", "Wolves", "Storm", "Knights", "Pioneers", "Miners", "Owls", "Titans",
+    "Falcons", "Bison", "Comets", "Mustangs", "Rebels", "Spartans", "Vikings", "Cougars", "Raiders", "Pilots",
+]
+FIRST_NAMES = [
+    "James", "Michael", "Chris", "David", "Marcus", "Tyler", "Jalen", "Derrick", "Aaron", "Justin",
+    "Brandon", "Kevin", "Travis", "Josh", "Cameron", "Darius", "Andre", "Trevor", "Caleb", "Isaiah",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Davis", "Miller", "Wilson", "Moore", "Taylor",
+    "Anderson", "Thomas", "Jackson", "White", "Harris", "Martin", "Thompson", "Robinson", "Clark", "Lewis",
+]
+# Position -> share of a roster.
+POSITIONS = {"QB": 3, "RB": 4, "WR": 6, "TE": 3, "OL": 9, "DL": 9, "LB": 7, "CB": 6, "S": 4, "K": 1, "P": 1}
+
+# Kickoff slots: day offset from the week's Thursday and UTC seconds into that day.
+_SLOT_DAYS = np.array([0, 2, 3, 3, 3, 4])
+_SLOT_SECONDS = np.array([24 * 3600 + 1200, 17 * 3600, 17 * 3600, 20 * 3600 + 1500, 24 * 3600 + 1200, 24 * 3600 + 900])
+_SLOT_WEIGHTS = {
+    "NFL": np.array([0.06, 0.0, 0.55, 0.27, 0.06, 0.06]),
+    "NCAA": np.array([0.05, 0.9, 0.02, 0.01, 0.01, 0.01]),
+}
+
+QUARTER_SECONDS = 45 * 60
+GAME_SECONDS = 4 * 3600
+_KINDS = {"teams": 1, "games": 2, "odds": 3, "players": 4}
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """How much data one league generates."""
+    teams: int = 32
+    seasons: int = 3
+    weeks: int = 18
+    games_per_week: int = 16
+    bookmakers_per_game: int = 8
+    players_per_roster: int = 53
+
+    @classmethod
+    def for_league(cls, league: int, **overrides):
+        """Real-world sizes: NFL (league 1) or FBS college football (any other league)."""
+        base = cls() if league == 1 else cls(teams=134, weeks=15, games_per_week=60, players_per_roster=85)
+        return replace(base, **{k: v for k, v in overrides.items() if v is not None})
+
+
+def _season_start(season: int) -> np.int64:
+    """Epoch seconds of the first Thursday on or after September 4th."""
+    start = np.datetime64(f"{season}-09-04")
+    weekday = (start.astype("datetime64[D]").astype(np.int64) + 3) % 7   # 0 = Monday
+    return (start + np.timedelta64(int((3 - weekday) % 7), "D")).astype("datetime64[s]").astype(np.int64)
+
+
+class SyntheticDataset:
+    """
+    One league's seasons `first_season .. first_season + scale.seasons - 1`.
+    `now` decides which games are finished, in progress or scheduled
+    (default: the current hour, UTC).
+    """
+
+    def __init__(self, seed: int = 0, league: int = 1, first_season: int = 2023,
+                 scale: SyntheticScale = None, now: datetime = None):
+        self.seed = seed
+        self.league = league
+        self.first_season = first_season
+        self.scale = scale or SyntheticScale.for_league(league)
+        now = now or datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        self.now = int(now.timestamp())
+        self._cache = {}
+
+    @property
+    def seasons(self):
+        return list(range(self.first_season, self.first_season + self.scale.seasons))
+
+    def _rng(self, kind: str, season: int = 0) -> np.random.Generator:
+        return np.random.default_rng([self.seed, self.league, season, _KINDS[kind]])
+
+    def _cached(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    # ----- Teams -----
+    def team_arrays(self):
+        """Per-team columns; team strength is fixed across seasons."""
+        def build():
+            n = self.scale.teams
+            rng = self._rng("teams")
+            known = NFL_TEAMS if self.league == 1 else NCAA_TEAMS
+            conferences = ["AFC", "NFC"] if self.league == 1 else ["SEC", "Big Ten", "ACC", "Big 12", "Pac-12", "Mountain West"]
+            divisions = ["East", "North", "South", "West"]
+            ids = np.arange(n) + self.league * 10_000 + 1
+            names, codes, confs, divs = [], [], [], []
+            for i in range(n):
+                if i < len(known):
+                    team = known[i]
+                    names.append(team["name"])
+                    codes.append(team["code"])
+                    confs.append(team["conference"])
+                    divs.append(team["division"])
+                else:
+                    city, mascot = CITIES[i % len(CITIES)], MASCOTS[(i // len(CITIES)) % len(MASCOTS)]
+                    suffix = f" {i // (len(CITIES) * len(MASCOTS)) + 1}" if i >= len(CITIES) * len(MASCOTS) else ""
+                    names.append(f"{city} {mascot}{suffix}")
+                    codes.append(f"{city[:2]}{mascot[0]}{i}".upper())
+                    confs.append(conferences[i % len(conferences)])
+                    divs.append(divisions[(i // len(conferences)) % len(divisions)])
+            return {
+                "id": ids,
+                "name": np.array(names, dtype=object),
+                "code": np.array(codes, dtype=object),
+                "conference": np.array(confs, dtype=object),
+                "division": np.array(divs, dtype=object),
+                "venue": np.arange(n) % len(VENUES),
+                "rating": rng.normal(0.0, 1.0, n),
+            }
+        return self._cached(("teams",), build)
+
+    def teams(self):
+        t = self.team_arrays()
+        return [
+            {
+                "id": int(t["id"][i]),
+                "name": t["name"][i],
+                "code": t["code"][i],
+                "city": VENUES[t["venue"][i]]["city"],
+                "logo": f"https://media.api-sports.io/american-football/teams/{int(t['id'][i])}.png",
+                "conference": t["conference"][i],
+                "division": t["division"][i],
+            }
+            for i in range(len(t["id"]))
+        ]
+
+    # ----- Games -----
+    def game_arrays(self, season: int):
+        """
+        Per-game columns for one season. Home/away are row indices into
+        team_arrays(); scores are (games, 2, 5) quarter points with -1 where a
+        period has not been played (index 4 is overtime).
+        """
+        def build():
+            s = self.scale
+            rng = self._rng("games", season)
+            teams = self.team_arrays()
+            n_teams, per_week = s.teams, s.games_per_week
+
+            # Pairings: shuffled team order per week, consecutive pairs play each other.
+            reps = -(-2 * per_week // n_teams)
+            order = np.concatenate(
+                [rng.permuted(np.tile(np.arange(n_teams), (s.weeks, 1)), axis=1) for _ in range(reps)], axis=1)
+            home = order[:, 0:2 * per_week:2].ravel()
+            away = order[:, 1:2 * per_week:2].ravel()
+            away = np.where(home == away, (away + 1) % n_teams, away)
+            week = np.repeat(np.arange(1, s.weeks + 1), per_week)
+            n = len(home)
+
+            slot = rng.choice(len(_SLOT_DAYS), size=n, p=_SLOT_WEIGHTS["NFL" if self.league == 1 else "NCAA"])
+            kickoff = _season_start(season) + (week - 1) * 7 * 86400 + _SLOT_DAYS[slot] * 86400 + _SLOT_SECONDS[slot]
+
+            edge = teams["rating"][home] - teams["rating"][away] + 0.3
+            td_rate = 0.6 * np.exp(np.stack([0.15 * edge, -0.15 * edge], axis=1))[:, :, None]
+            points = 7 * rng.poisson(td_rate, (n, 2, 4)) + 3 * rng.poisson(0.4, (n, 2, 4))
+            overtime = np.where(rng.random((n, 2)) < 0.5, 3, 0)
+            overtime[:, 1] = np.where(overtime[:, 0] == 3, 0, 3)
+
+            elapsed = self.now - kickoff
+            finished = elapsed >= GAME_SECONDS
+            played = np.clip(elapsed // QUARTER_SECONDS + 1, 0, 4)
+            played[finished] = 4
+            tied = finished & (points[:, 0].sum(axis=1) == points[:, 1].sum(axis=1))
+
+            scores = np.full((n, 2, 5), -1, dtype=np.int16)
+            scores[:, :, :4] = np.where(np.arange(4) < played[:, None, None], points, -1)
+            scores[tied, :, 4] = overtime[tied]
+
+            status = np.full(n, "NS", dtype=object)
+            live = (elapsed >= 0) & ~finished
+            status[live] = np.array(["Q1", "Q2", "Q3", "Q4"], dtype=object)[played[live] - 1]
+            status[live & (elapsed >= 2 * QUARTER_SECONDS) & (elapsed < 2 * QUARTER_SECONDS + 1200)] = "HT"
+            status[finished] = "FT"
+            status[tied] = "AOT"
+
+            base = (self.league * 100 + season % 100) * 100_000
+            return {
+                "id": base + np.arange(n),
+                "week": week,
+                "home": home,
+                "away": away,
+                "kickoff": kickoff,
+                "status": status,
+                "scores": scores,
+                "edge": edge,
+            }
+        return self._cached(("games", season), build)
+
+    def games(self, season: int):
+        g = self.game_arrays(season)
+        t = self.team_arrays()
+        stamps = np.datetime_as_string(g["kickoff"].astype("datetime64[s]"), unit="m")
+        scores = g["scores"].tolist()
+
+        def team(i):
+            team_id = int(t["id"][i])
+            return {"id": team_id, "name": t["name"][i],
+                    "logo": f"https://media.api-sports.io/american-football/teams/{team_id}.png"}
+
+        def side(points):
+            quarters = {f"quarter_{q + 1}": (p if p >= 0 else None) for q, p in enumerate(points[:4])}
+            total = sum(p for p in points if p > 0) if points[0] >= 0 else None
+            return {**quarters, "overtime": points[4] if points[4] >= 0 else None, "total": total}
+
+        games = []
+        for i in range(len(g["id"])):
+            venue = VENUES[t["venue"][g["home"][i]]]
+            games.append({
+                "game": {
+                    "id": int(g["id"][i]),
+                    "stage": "Regular Season",
+                    "week": f"Week {int(g['week'][i])}",
+                    "date": {
+                        "timezone": "UTC",
+                        "date": stamps[i][:10],
+                        "time": stamps[i][11:16],
+                        "timestamp": int(g["kickoff"][i]),
+                    },
+                    "venue": {"name": venue["name"], "city": venue["city"]},
+                    "status": {"short": g["status"][i], "long": g["status"][i], "timer": None},
+                },
+                "league": {"id": self.league, "season": season},
+                "teams": {"home": team(g["home"][i]), "away": team(g["away"][i])},
+                "scores": {"home": side(scores[i][0]), "away": side(scores[i][1])},
+            })
+        return games
+
+    # ----- Odds -----
+    def odds_arrays(self, season: int):
+        """
+        Decimal odds for every game x bookmaker, shaped (games, bookmakers, 2)
+        per market (home/away, handicap home/away, over/under), plus the
+        handicap and total lines per game x bookmaker.
+        """
+        def build():
+            g = self.game_arrays(season)
+            rng = self._rng("odds", season)
+            n, b = len(g["id"]), self.scale.bookmakers_per_game
+            margin = rng.uniform(1.03, 1.07, (n, b, 1))
+
+            p_home = 1.0 / (1.0 + np.exp(-0.9 * g["edge"]))[:, None]
+            p_home = np.clip(p_home + rng.normal(0.0, 0.02, (n, b)), 0.03, 0.97)
+            moneyline = 1.0 / (np.stack([p_home, 1.0 - p_home], axis=2) * margin)
+
+            p_cover = np.clip(0.5 + rng.normal(0.0, 0.02, (n, b)), 0.4, 0.6)
+            handicap = 1.0 / (np.stack([p_cover, 1.0 - p_cover], axis=2) * margin)
+            p_over = np.clip(0.5 + rng.normal(0.0, 0.02, (n, b)), 0.4, 0.6)
+            totals = 1.0 / (np.stack([p_over, 1.0 - p_over], axis=2) * margin)
+
+            spread = np.floor(-6.0 * g["edge"])[:, None] + 0.5 + rng.integers(-1, 2, (n, b))
+            total_line = np.floor(44.0 + 4.0 * np.abs(g["edge"]))[:, None] + 0.5 + rng.integers(-1, 2, (n, b))
+            return {
+                "bookmakers": np.arange(b),
+                "moneyline": np.round(moneyline, 2),
+                "handicap": np.round(handicap, 2),
+                "totals": np.round(totals, 2),
+                "spread": spread,
+                "total_line": total_line,
+            }
+        return self._cached(("odds", season), build)
+
+    def bookmaker_names(self):
+        return [BOOKMAKERS[k] if k < len(BOOKMAKERS) else f"Bookmaker {k + 1}"
+                for k in range(self.scale.bookmakers_per_game)]
+
+    def odds(self, season: int):
+        g = self.game_arrays(season)
+        o = self.odds_arrays(season)
+        names = self.bookmaker_names()
+        # API-Sports sends odds as strings; format the whole block at once.
+        moneyline = np.char.mod("%.2f", o["moneyline"]).tolist()
+        handicap = np.char.mod("%.2f", o["handicap"]).tolist()
+        totals = np.char.mod("%.2f", o["totals"]).tolist()
+        spread = o["spread"].tolist()
+        total_line = o["total_line"].tolist()
+        update = datetime.fromtimestamp(self.now, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+        entries = []
+        for i in range(len(g["id"])):
+            bookmakers = []
+            for k, name in enumerate(names):
+                line = spread[i][k]
+                bookmakers.append({
+                    "id": k + 1,
+                    "name": name,
+                    "bets": [
+                        {"id": 1, "name": "Home/Away", "values": [
+                            {"value": "Home", "odd": moneyline[i][k][0]},
+                            {"value": "Away", "odd": moneyline[i][k][1]}]},
+                        {"id": 2, "name": "Asian Handicap", "values": [
+                            {"value": f"Home {line:+g}", "odd": handicap[i][k][0]},
+                            {"value": f"Away {-line:+g}", "odd": handicap[i][k][1]}]},
+                        {"id": 3, "name": "Over/Under", "values": [
+                            {"value": f"Over {total_line[i][k]:g}", "odd": totals[i][k][0]},
+                            {"value": f"Under {total_line[i][k]:g}", "odd": totals[i][k][1]}]},
+                    ],
+                })
+            entries.append({
+                "league": {"id": self.league, "season": season},
+                "game": {"id": int(g["id"][i])},
+                "update": update,
+                "bookmakers": bookmakers,
+            })
+        return entries
+
+    # ----- Standings -----
+    def standings(self, season: int):
+        """Standings aggregated from the season's finished games."""
+        g = self.game_arrays(season)
+        t = self.team_arrays()
+        n_teams = self.scale.teams
+        done = np.isin(g["status"], ["FT", "AOT"])
+        home, away = g["home"][done], g["away"][done]
+        totals = np.where(g["scores"][done] < 0, 0, g["scores"][done]).sum(axis=2)
+        margin = totals[:, 0] - totals[:, 1]
+        same_conf = t["conference"][home] == t["conference"][away]
+        same_div = same_conf & (t["division"][home] == t["division"][away])
+
+        def count(teams, mask):
+            return np.bincount(teams[mask], minlength=n_teams)
+
+        won = count(home, margin > 0) + count(away, margin < 0)
+        lost = count(home, margin < 0) + count(away, margin > 0)
+        ties = count(home, margin == 0) + count(away, margin == 0)
+        points_for = (np.bincount(home, totals[:, 0], n_teams) + np.bincount(away, totals[:, 1], n_teams)).astype(np.int64)
+        points_against = (np.bincount(home, totals[:, 1], n_teams) + np.bincount(away, totals[:, 0], n_teams)).astype(np.int64)
+
+        def record(mask_home, mask_away):
+            w = count(home, mask_home & (margin > 0)) + count(away, mask_away & (margin < 0))
+            l = count(home, mask_home & (margin < 0)) + count(away, mask_away & (margin > 0))
+            return w, l
+
+        everyone = np.ones(len(home), dtype=bool)
+        home_rec = record(everyone, np.zeros_like(everyone))
+        road_rec = record(np.zeros_like(everyone), everyone)
+        conf_rec = record(same_conf, same_conf)
+        div_rec = record(same_div, same_div)
+
+        played = np.maximum(won + lost + ties, 1)
+        pct = (won + 0.5 * ties) / played
+        # Position within the conference: best win percentage, then point difference.
+        order = np.lexsort((-(points_for - points_against), -pct, t["conference"].astype(str)))
+        position = np.empty(n_teams, dtype=np.int64)
+        conf_sorted = t["conference"][order]
+        starts = np.r_[0, np.flatnonzero(conf_sorted[1:] != conf_sorted[:-1]) + 1]
+        position[order] = np.arange(n_teams) - np.repeat(starts, np.diff(np.r_[starts, n_teams]))
+
+        return [
+            {
+                "league": {"id": self.league, "season": season},
+                "conference": CONFERENCE_NAMES.get(t["conference"][i], t["conference"][i]),
+                "division": t["division"][i],
+                "position": int(position[i]) + 1,
+                "team": {"id": int(t["id"][i]), "name": t["name"][i],
+                         "logo": f"https://media.api-sports.io/american-football/teams/{int(t['id'][i])}.png"},
+                "won": int(won[i]),
+                "lost": int(lost[i]),
+                "ties": int(ties[i]),
+                "points": {
+                    "for": int(points_for[i]),
+                    "against": int(points_against[i]),
+                    "difference": int(points_for[i] - points_against[i]),
+                },
+                "records": {
+                    "home": f"{home_rec[0][i]}-{home_rec[1][i]}",
+                    "road": f"{road_rec[0][i]}-{road_rec[1][i]}",
+                    "conference": f"{conf_rec[0][i]}-{conf_rec[1][i]}",
+                    "division": f"{div_rec[0][i]}-{div_rec[1][i]}",
+                },
+                "streak": None,
+            }
+            for i in order
+        ]
+
+    # ----- Players -----
+    def players(self, season: int):
+        """Flat /players rows: `players_per_roster` per team."""
+        s = self.scale
+        t = self.team_arrays()
+        rng = self._rng("players", season)
+        n = s.teams * s.players_per_roster
+        team_idx = np.repeat(np.arange(s.teams), s.players_per_roster)
+        shares = np.array(list(POSITIONS.values()), dtype=float)
+        position = rng.choice(list(POSITIONS), size=n, p=shares / shares.sum())
+        first = rng.integers(0, len(FIRST_NAMES), n)
+        last = rng.integers(0, len(LAST_NAMES), n)
+        age = rng.integers(21, 36, n)
+        height = rng.integers(69, 80, n)
+        weight = np.where(np.isin(position, ["OL", "DL"]), rng.integers(280, 340, n), rng.integers(185, 250, n))
+        number = rng.integers(1, 100, n)
+        injured = rng.random(n) < 0.06
+        base = (self.league * 100 + season % 100) * 1_000_000
+
+        return [
+            {
+                "id": base + i,
+                "name": f"{FIRST_NAMES[first[i]]} {LAST_NAMES[last[i]]}",
+                "age": int(age[i]),
+                "height": f"{height[i] // 12}' {height[i] % 12}\"",
+                "weight": f"{weight[i]} lbs",
+                "college": None,
+                "group": "Offense" if position[i] in ("QB", "RB", "WR", "TE", "OL") else "Defense",
+                "position": str(position[i]),
+                "number": int(number[i]),
+                "injured": bool(injured[i]),
+                "team_id": int(t["id"][team_idx[i]]),
+                "image": None,
+            }
+            for i in range(n)
+        ]
+
+    # ----- Output -----
+    def envelope(self, endpoint: str, season: int, response):
+        return {
+            "get": endpoint,
+            "parameters": {"league": str(self.league), "season": str(season)},
+            "errors": [],
+            "results": len(response),
+            "response": response,
+        }
+
+    def write(self, directory: str):
+        """
+        Write every season as API envelopes:
+        <directory>/league-<id>/<season>/<endpoint>.json, plus manifest.json.
+        Returns {path: rows}.
+        """
+        written = {}
+        root = os.path.join(directory, f"league-{self.league}")
+        for season in self.seasons:
+            season_dir = os.path.join(root, str(season))
+            os.makedirs(season_dir, exist_ok=True)
+            for endpoint in ("teams", "games", "odds", "standings", "players"):
+                response = getattr(self, endpoint)(season) if endpoint != "teams" else self.teams()
+                path = os.path.join(season_dir, f"{endpoint}.json")
+                with open(path, "w") as f:
+                    json.dump(self.envelope(endpoint, season, response), f, separators=(",", ":"))
+                written[path] = len(response)
+            # The dict views are disposable; keep only the arrays for the next season.
+            self._cache = {k: v for k, v in self._cache.items() if k[0] == "teams"}
+        with open(os.path.join(root, "manifest.json"), "w") as f:
+            json.dump({"seed": self.seed, "league": self.league, "first_season": self.first_season,
+                       "now": self.now, "scale": asdict(self.scale)}, f, indent=2)
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seeded synthetic API-Sports american-football data")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--league", type=int, default=1, help="1 = NFL sizes, anything else = NCAA sizes")
+    parser.add_argument("--first-season", type=int, default=2023)
+    parser.add_argument("--seasons", type=int)
+    parser.add_argument("--teams", type=int)
+    parser.add_argument("--weeks", type=int)
+    parser.add_argument("--games-per-week", type=int)
+    parser.add_argument("--bookmakers", type=int, dest="bookmakers_per_game")
+    parser.add_argument("--players-per-roster", type=int)
+    parser.add_argument("--now", type=datetime.fromisoformat, default=None,
+                        help="ISO timestamp deciding finished/live/scheduled games (default: this hour)")
+    parser.add_argument("--out", help="write JSON envelopes here (default: only report sizes)")
+    args = parser.parse_args()
+
+    scale = SyntheticScale.for_league(
+        args.league, seasons=args.seasons, teams=args.teams, weeks=args.weeks,
+        games_per_week=args.games_per_week, bookmakers_per_game=args.bookmakers_per_game,
+        players_per_roster=args.players_per_roster)
+    now = args.now.replace(tzinfo=args.now.tzinfo or timezone.utc) if args.now else None
+    dataset = SyntheticDataset(args.seed, args.league, args.first_season, scale, now)
+
+    started = time.perf_counter()
+    if args.out:
+        written = dataset.write(args.out)
+        rows = sum(written.values())
+        print(f"🏈 Wrote {len(written)} files ({rows:,} rows) to {args.out} in {time.perf_counter() - started:.1f}s")
+        return
+    for season in dataset.seasons:
+        games = dataset.game_arrays(season)
+        odds = dataset.odds_arrays(season)
+        print(f"{season}: {len(games['id']):,} games, {odds['moneyline'].shape[0] * odds['moneyline'].shape[1] * len(BETS) * 2:,} odds rows")
+    print(f"Generated in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import numpy as np
+
+from date_normalizer import normalize_dates
+
+
+def test_out_of_range_epochs_become_nat_and_are_counted():
+    kickoffs, unrecognised = normalize_dates([1725826800, 1725826800000, {"timestamp": 10**15}, float("inf")])
+    assert str(kickoffs[0]) == "2024-09-08T20:20:00"
+    assert np.isnat(kickoffs[1:]).all()
+    assert unrecognised == 3
+
+
+def test_digit_strings_are_epochs_only_at_epoch_length():
+    kickoffs, unrecognised = normalize_dates(["1725826800", "20240908", "1725826800000"])
+    assert [str(k) for k in kickoffs] == ["2024-09-08T20:20:00", "2024-09-08T00:00:00", "NaT"]
+    assert unrecognised == 1
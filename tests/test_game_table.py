@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+from game_table import KickoffIndex
+
+
+def at(day, hour=0):
+    return datetime(2025, 9, day, hour, tzinfo=timezone.utc)
+
+
+def ts(day, hour=0):
+    return int(at(day, hour).timestamp())
+
+
+def make_index():
+    return KickoffIndex([
+        ("c", ts(14, 17), "Week 2"),
+        ("a", ts(7, 17), "Week 1"),
+        ("b", ts(7, 20), "Week 1"),
+        ("d", ts(14, 17), "Week 2"),
+        ("tbd", None, "Week 2"),
+    ])
+
+
+def test_between_is_inclusive_and_after_excludes_the_start():
+    index = make_index()
+    assert index.between(at(7, 17), at(14, 17)) == ["a", "b", "c", "d"]
+    assert index.between(at(7, 17), at(14, 17), after=True) == ["b", "c", "d"]
+    assert index.between(at(8), at(13)) == []
+    assert index.between(None, at(7, 18)) == ["a"]
+    assert index.between(at(14), None) == ["c", "d"]
+
+
+def test_games_without_kickoff_are_only_reachable_by_week():
+    index = make_index()
+    assert "tbd" not in index.between(None, None)
+    assert index.week("Week 2") == ["c", "d", "tbd"]
+    assert index.weeks() == ["Week 1", "Week 2"]
+    assert index.week("Week 9") == []
+
+
+def test_upsert_moves_a_rescheduled_kickoff():
+    index = make_index()
+    index.upsert("a", ts(21, 17), "Week 3")
+
+    assert len(index) == 5
+    assert index.between(at(7), at(8)) == ["b"]
+    assert index.between(at(21), at(22)) == ["a"]
+    assert index.week("Week 1") == ["b"]
+    assert index.weeks() == ["Week 1", "Week 2", "Week 3"]
+
+    index.upsert("b", ts(14, 12), "Week 2")
+    assert index.weeks() == ["Week 2", "Week 3"]
+    assert index.week("Week 2") == ["b", "c", "d", "tbd"]
+
+
+def test_upsert_of_equal_kickoffs_removes_the_right_key():
+    index = make_index()
+    index.upsert("d", None, "Week 2")
+    assert index.between(at(14), at(15)) == ["c"]
+    assert index.week("Week 2") == ["c", "tbd", "d"]
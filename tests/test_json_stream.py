@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from json_stream import iter_json_array
+
+PAYLOAD = {
+    "get": "games",
+    "errors": [],
+    "response": [
+        {"id": 1, "name": 'Patrick "Pat" Mahomes é\u00e9', "path": "a\\b\n"},
+        {"id": 2, "scores": [[7, 3], [], [0, [14, 21]]], "odd": 1.95},
+        [1, [2, [3]]],
+        "plain string",
+        12345,
+    ],
+    "paging": {"current": 1, "total": 1},
+}
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_items_and_envelope_survive_any_chunk_boundary(size):
+    text = json.dumps(PAYLOAD, ensure_ascii=False)
+    envelope = {}
+    items = list(iter_json_array(chunked(text, size), "response", envelope))
+    assert items == PAYLOAD["response"]
+    assert envelope == {"get": "games", "errors": [], "paging": {"current": 1, "total": 1}}
+
+
+def test_boundaries_inside_escapes():
+    text = '{"response": ["a\\\\", "\\"q\\"", "\\u00e9x", "tab\\tend"]}'
+    for cut in range(1, len(text)):
+        assert list(iter_json_array([text[:cut], text[cut:]])) == ["a\\", '"q"', "éx", "tab\tend"]
+
+
+def test_empty_array_and_missing_key():
+    assert list(iter_json_array(['{"response": [ ]}'])) == []
+    assert list(iter_json_array(["{", '"response"', ":", "[]", "}"])) == []
+    envelope = {}
+    assert list(iter_json_array(['{"errors": {"token": "bad"}, "response": {}}'], envelope=envelope)) == []
+    assert envelope == {"errors": {"token": "bad"}, "response": {}}
+
+
+@pytest.mark.parametrize("text", [
+    '{"response": [{"id": 1}, {"id": 2',
+    '{"response": [{"id": 1}, ',
+    '{"response": [1, 2',
+    '{"response": ["unterminated',
+    '{"response": [1]',
+    '{"resp',
+    '{',
+    '',
+])
+def test_truncated_input_raises(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunked(text, 3)))
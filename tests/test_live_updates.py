@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+from live_updates import LiveScoreEngine
+from models import Game
+
+NOW = datetime(2025, 9, 7, 19, 0, tzinfo=timezone.utc)
+
+
+def game(game_id, kickoff, status="NS", home_score=None, week="Week 1"):
+    return Game(home_team=f"Home {game_id}", away_team=f"Away {game_id}", home_score=home_score,
+                away_score=None, venue="", date=kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                status=status, scores={}, game_id=game_id, week=week)
+
+
+class FakeClient:
+    """Serves Game objects (the engine's parse_fn is the identity); None means the request fails."""
+
+    def __init__(self, season=None, window=None):
+        self.season = season
+        self.window = window
+
+    def iter_games(self, league, season, **_):
+        if self.season is None:
+            raise ConnectionError("upstream down")
+        return list(self.season)
+
+    def get_games(self, league, season, date_from=None, date_to=None):
+        return list(self.window or [])
+
+
+def engine():
+    return LiveScoreEngine(1, 2025, parse_fn=list)
+
+
+def test_failed_load_keeps_previous_games_and_is_retried():
+    live = engine()
+    live.sync(FakeClient([game(1, NOW), game(2, NOW + timedelta(days=7))]), NOW)
+    assert sorted(live.games) == [1, 2]
+
+    live._loaded_at = None  # force a reload
+    live.sync(FakeClient(None), NOW)
+    assert sorted(live.games) == [1, 2]
+    assert isinstance(live.load_error, ConnectionError)
+    assert live._loaded_at is None
+
+    live.sync(FakeClient([game(1, NOW, status="Q1", home_score=7)]), NOW)
+    assert sorted(live.games) == [1]
+    assert live.load_error is None
+    assert live.last_changed == {1}
+
+
+def test_poll_moves_a_rescheduled_kickoff_in_the_index():
+    live = engine()
+    kickoff = NOW - timedelta(hours=1)
+    live.sync(FakeClient([game(1, kickoff, status="Q2"), game(2, kickoff)]), NOW)
+
+    moved = NOW + timedelta(days=2)
+    live._polled_at = 0.0
+    changed = live.sync(FakeClient(window=[game(2, moved, week="Week 2")]), NOW)
+
+    assert changed == {2}
+    assert [g.game_id for g in live.between(kickoff, NOW)] == [1]
+    assert [g.game_id for g in live.between(NOW, moved)] == [2]
+    assert live.weeks() == ["Week 1", "Week 2"]
+    assert [g.game_id for g in live.week_games("Week 2")] == [2]
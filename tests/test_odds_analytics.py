@@ -0,0 +1,48 @@
+import pandas as pd
+
+from odds_analytics import MarketBoard, split_options
+from odds_table import COLUMNS
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=COLUMNS).astype({"game_id": "Int64", "odd": float})
+
+
+def test_split_options_keys_handicaps_from_the_home_side():
+    outcome, line = split_options(pd.Series(["Home -7.5", "Away +7.5", "Home +7.5", "Over 49.5", "Home"]))
+    assert list(outcome) == ["Home", "Away", "Home", "Over", "Home"]
+    assert list(line) == [-7.5, -7.5, 7.5, 49.5, 0.0]
+
+
+def test_opposite_signed_spreads_are_not_an_arbitrage():
+    board = MarketBoard(frame([
+        (1, "A", "Asian Handicap", "Home -7.5", 2.60),
+        (1, "A", "Asian Handicap", "Away +7.5", 1.50),
+        (1, "B", "Asian Handicap", "Home +7.5", 1.50),
+        (1, "B", "Asian Handicap", "Away -7.5", 2.60),
+    ]))
+    assert sorted(board.markets["line"]) == [-7.5, 7.5]
+    assert board.arbitrages().empty
+    assert not (board.board()["Arb edge %"] > 0).any()
+
+
+def test_arbitrage_across_bookmakers_on_one_line():
+    board = MarketBoard(frame([
+        (1, "A", "Asian Handicap", "Home -7.5", 2.20),
+        (1, "A", "Asian Handicap", "Away +7.5", 1.70),
+        (1, "B", "Asian Handicap", "Home -7.5", 1.70),
+        (1, "B", "Asian Handicap", "Away +7.5", 2.20),
+    ]))
+    arbs = board.arbitrages()
+    assert len(arbs) == 1 and arbs["line"].iloc[0] == -7.5
+    assert board.board().loc[0, "Market"] == "Asian Handicap -7.5"
+
+
+def test_empty_board():
+    empty = MarketBoard(frame([]))
+    assert empty.board().empty
+    assert empty.board({1: "Away @ Home"}).empty
+
+    board = MarketBoard(frame([(1, "A", "Over/Under", "Over 49.5", 1.9), (1, "A", "Over/Under", "Under 49.5", 1.9)]))
+    assert board.board({2: "Other game"}).empty
+    assert list(board.board({1: "Away @ Home"})["Market"]) == ["Over/Under 49.5"]
@@ -0,0 +1,30 @@
+from player_search import PlayerSearchIndex
+
+
+def names(players):
+    return [p["name"] for p in players]
+
+
+def test_changed_roster_replaces_the_teams_rows():
+    index = PlayerSearchIndex()
+    index.add_roster(1, [{"id": 1, "name": "Patrick Mahomes"}, {"id": 2, "name": "Travis Kelce"}])
+    index.add_roster(2, [{"id": 3, "name": "Josh Allen"}])
+    index.add_roster(1, [{"id": 1, "name": "Patrick Mahomes", "injured": True}, {"id": 4, "name": "Rashee Rice"}])
+
+    assert len(index) == 3
+    assert index.search("kelce") == []
+    assert index.search("mahomes") == [{"id": 1, "name": "Patrick Mahomes", "injured": True}]
+    assert names(index.search("", team_id=1)) == ["Patrick Mahomes", "Rashee Rice"]
+    assert names(index.search("allen")) == ["Josh Allen"]
+
+
+def test_unchanged_roster_is_not_reindexed_and_replacements_compact():
+    index = PlayerSearchIndex()
+    index.add_roster(1, [{"id": 1, "name": "Josh Allen"}])
+    index.add_roster(1, [{"id": 1, "name": "Josh Allen"}])
+    assert len(index._players) == 1
+
+    for i in range(5):
+        index.add_roster(1, [{"id": 9, "name": f"Player {i}"}])
+    assert len(index._players) <= 2
+    assert names(index.search("player")) == ["Player 4"]